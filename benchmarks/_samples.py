@@ -0,0 +1,146 @@
+"""Sample request objects for the benchmarks, one per registered adapter.
+
+Each builder is skipped when its library is not installed, the same way the
+adapter itself would not be registered.
+"""
+
+import asyncio
+import urllib.request
+
+from collections.abc import Callable
+from contextlib import suppress
+from typing import Any
+
+URL = "https://httpbin.org/post?foo=911"
+BODY = b'{"hello": "world"}'
+HEADERS = {"content-type": "application/json", "x-request-id": "4f2d1c7e", "cookie": "session=abc"}
+
+
+def _requests() -> object:
+    import requests
+
+    return requests.Request("POST", URL, headers=HEADERS, data=BODY).prepare()
+
+
+def _niquests() -> object:
+    import niquests
+
+    return niquests.Request("POST", URL, headers=HEADERS, data=BODY).prepare()
+
+
+def _httpx() -> object:
+    import httpx
+
+    return httpx.Request("POST", URL, headers=HEADERS, content=BODY)
+
+
+def _httpx2() -> object:
+    import httpx2
+
+    return httpx2.Request("POST", URL, headers=HEADERS, content=BODY)
+
+
+def _urllib() -> object:
+    return urllib.request.Request(URL, headers=HEADERS, data=BODY)
+
+
+def _django() -> object:
+    from django.conf import settings
+
+    if not settings.configured:
+        settings.configure(ALLOWED_HOSTS=["testserver"])
+    from django.test import RequestFactory
+
+    return RequestFactory().post("/post?foo=911", data=BODY, content_type="application/json")
+
+
+def _werkzeug() -> object:
+    import werkzeug.test
+
+    return werkzeug.test.EnvironBuilder(
+        base_url="https://httpbin.org",
+        path="/post",
+        method="POST",
+        headers=list(HEADERS.items()),
+        data=BODY,
+    ).get_request()
+
+
+def _tornado() -> object:
+    import tornado.httpclient
+
+    return tornado.httpclient.HTTPRequest(URL, method="POST", headers=HEADERS, body=BODY)
+
+
+def _tornado_server() -> object:
+    import tornado.httputil
+
+    return tornado.httputil.HTTPServerRequest(
+        method="POST",
+        uri="/post?foo=911",
+        host="httpbin.org",
+        headers=tornado.httputil.HTTPHeaders(HEADERS),
+        body=BODY,
+    )
+
+
+def _aiohttp_server() -> object:
+    from aiohttp.test_utils import make_mocked_request
+
+    return make_mocked_request("POST", "/post?foo=911", headers=HEADERS)
+
+
+def _aiohttp_client() -> object:
+    import aiohttp
+    import yarl
+
+    async def build() -> object:
+        return aiohttp.ClientRequest("POST", yarl.URL(URL), headers=HEADERS, data=BODY, loop=asyncio.get_running_loop())
+
+    return asyncio.run(build())
+
+
+def _starlette() -> object:
+    from starlette.requests import Request
+
+    return Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "scheme": "https",
+            "server": ("httpbin.org", 443),
+            "path": "/post",
+            "query_string": b"foo=911",
+            "headers": [(name.encode(), value.encode()) for name, value in HEADERS.items()],
+        }
+    )
+
+
+SYNC_SAMPLES: dict[str, Callable[[], object]] = {
+    "requests": _requests,
+    "niquests": _niquests,
+    "httpx": _httpx,
+    "httpx2": _httpx2,
+    "django": _django,
+    "werkzeug": _werkzeug,
+    "tornado client": _tornado,
+    "tornado server": _tornado_server,
+    "urllib": _urllib,
+}
+ASYNC_SAMPLES: dict[str, Callable[[], object]] = {
+    "httpx2": _httpx2,
+    "httpx": _httpx,
+    "aiohttp server": _aiohttp_server,
+    "aiohttp client": _aiohttp_client,
+    "starlette": _starlette,
+}
+
+
+def build(
+    samples: dict[str, Callable[[], object]],
+) -> dict[str, Any]:
+    built = {}
+    for name, builder in samples.items():
+        with suppress(ImportError):
+            built[name] = builder()
+    return built
@@ -0,0 +1,56 @@
+"""Adapter dispatch: the cached type lookup against the linear scan it replaced.
+
+    python -m benchmarks.bench_dispatch
+
+The linear scan constructs every adapter in registration order until one stops
+raising ValueError, which is what _find_request_data_obj did before the cache.
+It needs every adapter imported up front, and so every library.
+"""
+
+import timeit
+
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks._samples import ASYNC_SAMPLES, SYNC_SAMPLES, build
+from curlify3._utils import (
+    _REQUEST_DATA_CLASSES,
+    _REQUEST_DATA_CLASSES_ASYNC,
+    _import_name,
+    make_request_obj,
+    make_request_obj_async,
+)
+
+NUMBER = 100_000
+
+
+def linear_scan(
+    request: object,
+    request_data_classes: list[Any],
+) -> object:
+    for _cls in request_data_classes:
+        try:
+            return _cls(request)
+        except ValueError:
+            continue
+    raise ValueError("unknown request object")
+
+
+def report(
+    title: str,
+    samples: dict[str, Any],
+    cached: Callable[[object], object],
+    registrations: list[Any],
+) -> None:
+    request_data_classes = [_import_name(entry.adapter) for entry in registrations]
+    print(f"{title:<16} {'cached, ns':>12} {'linear, ns':>12} {'speedup':>8}")
+    for name, request in samples.items():
+        fast = timeit.timeit(lambda request=request: cached(request), number=NUMBER) / NUMBER
+        slow = timeit.timeit(lambda request=request: linear_scan(request, request_data_classes), number=NUMBER) / NUMBER
+        print(f"{name:<16} {fast * 1e9:>12.0f} {slow * 1e9:>12.0f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    report("sync", build(SYNC_SAMPLES), make_request_obj, _REQUEST_DATA_CLASSES)
+    print()
+    report("async", build(ASYNC_SAMPLES), make_request_obj_async, _REQUEST_DATA_CLASSES_ASYNC)
@@ -0,0 +1,96 @@
+"""Render time with and without a FragmentCache over a realistic header mix.
+
+    python -m benchmarks.bench_fragment_cache [--requests 5000] [--lines 300]
+
+Every request carries the same handful of header names; their values are drawn
+from --lines distinct header lines with a Zipf-like skew (a few user agents,
+accept values and service-account tokens dominate), plus one x-request-id that
+is unique to the request and never hits — every cache size runs once caching
+it and once with it in skip_headers. Each row renders the same requests, so the
+rows differ only in the cache; evictions are per pass over the requests.
+"""
+
+import argparse
+import random
+import timeit
+import uuid
+
+from curlify3 import POWERSHELL, SH, FragmentCache, Renderer, RequestSnapshot
+
+NAMES = ["user-agent", "accept", "accept-encoding", "authorization", "content-type", "x-client-version"]
+SIZES = [64, 256, 1024, 4096]
+SKIP = ("x-request-id",)
+ROUNDS = 15
+
+
+def make_requests(
+    count: int,
+    lines: int,
+) -> list[RequestSnapshot]:
+    rng = random.Random(0)
+    values = {name: [f"{name}-value-{index}/{'x' * rng.randrange(8, 64)}" for index in range(lines)] for name in NAMES}
+    weights = [1 / (rank + 1) for rank in range(lines)]
+    requests = []
+    for _ in range(count):
+        headers = tuple((name, rng.choices(values[name], weights)[0]) for name in NAMES)
+        requests.append(
+            RequestSnapshot(
+                method="POST",
+                url="https://api.example.com/orders",
+                headers=(*headers, ("x-request-id", str(uuid.UUID(int=rng.getrandbits(128))))),
+                cookies=f"session={rng.choices(range(lines), weights)[0]}",
+                body='{"item":"book","qty":2}',
+            )
+        )
+    return requests
+
+
+def report(
+    shell: str,
+    requests: list[RequestSnapshot],
+) -> None:
+    def run(
+        renderer: Renderer,
+    ) -> float:
+        return timeit.timeit(lambda: [renderer.render_snapshot(request) for request in requests], number=1)
+
+    caches = {
+        f"{maxsize}{', skip' if skip else ''}": FragmentCache(maxsize, skip_headers=skip)
+        for maxsize in SIZES
+        for skip in ((), SKIP)
+    }
+    renderers: dict[str | None, Renderer] = {None: Renderer(shell)}
+    renderers.update({maxsize: Renderer(shell, fragment_cache=cache) for maxsize, cache in caches.items()})
+    # warm up: the steady state of a long-running service, not its first requests
+    for renderer in renderers.values():
+        run(renderer)
+    before = {maxsize: cache.info() for maxsize, cache in caches.items()}
+    # the rounds are interleaved and the fastest kept, so that a noisy neighbour slows all
+    # the rows alike rather than whichever happened to run at the time
+    timings: dict[str | None, list[float]] = {maxsize: [] for maxsize in renderers}
+    for _ in range(ROUNDS):
+        for maxsize, renderer in renderers.items():
+            timings[maxsize].append(run(renderer))
+    baseline = min(timings[None])
+    print(f"{shell:<12} {'maxsize':>10} {'ns/command':>11} {'saving':>7} {'hit rate':>9} {'evictions':>10}")
+    print(f"{'':<12} {'none':>10} {baseline / len(requests) * 1e9:>11.0f}")
+    for maxsize, cache in caches.items():
+        elapsed = min(timings[maxsize])
+        info = cache.info()
+        hits, misses = info.hits - before[maxsize].hits, info.misses - before[maxsize].misses
+        evictions = (info.evictions - before[maxsize].evictions) // ROUNDS
+        print(
+            f"{'':<12} {maxsize:>10} {elapsed / len(requests) * 1e9:>11.0f} {1 - elapsed / baseline:>7.0%} "
+            f"{hits / max(hits + misses, 1):>9.1%} {evictions:>10}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--lines", type=int, default=300)
+    arguments = parser.parse_args()
+    requests = make_requests(arguments.requests, arguments.lines)
+    report(SH, requests)
+    print()
+    report(POWERSHELL, requests)
@@ -0,0 +1,57 @@
+"""Start-up cost: importing curlify3 against importing it with every library.
+
+    python -m benchmarks.bench_import
+
+The adapters are registered by name and imported on first use, so a process
+that imports curlify3 pays only for it; before that, every installed library
+was imported along with it. Each figure is the best of several fresh
+interpreters, maximum RSS as reported by getrusage (Unix only).
+"""
+
+import subprocess
+import sys
+
+LIBRARIES = ["requests", "niquests", "httpx", "httpx2", "aiohttp.web", "starlette.requests", "django.http", "werkzeug"]
+LIBRARIES += ["tornado.httpclient", "tornado.httputil"]
+RUNS = 5
+
+PROBE = """
+import resource, time
+started = time.perf_counter()
+{imports}
+elapsed = time.perf_counter() - started
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def measure(
+    imports: str,
+) -> tuple[float, int]:
+    runs = []
+    for _ in range(RUNS):
+        completed = subprocess.run(
+            [sys.executable, "-c", PROBE.format(imports=imports)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        elapsed, rss = completed.stdout.split()
+        runs.append((float(elapsed), int(rss)))
+    return min(runs)
+
+
+def installed(
+    name: str,
+) -> bool:
+    return subprocess.run([sys.executable, "-c", f"import {name}"], capture_output=True).returncode == 0
+
+
+if __name__ == "__main__":
+    libraries = [name for name in LIBRARIES if installed(name)]
+    print(f"{'imports':<28} {'ms':>8} {'max rss, KiB':>14}")
+    for title, imports in [
+        ("curlify3", "import curlify3"),
+        ("curlify3 + every library", "\n".join(["import curlify3", *(f"import {name}" for name in libraries)])),
+    ]:
+        elapsed, rss = measure(imports)
+        print(f"{title:<28} {elapsed * 1e3:>8.1f} {rss:>14}")
@@ -0,0 +1,49 @@
+"""What a logging call site costs with to_curl() against lazy().
+
+    python -m benchmarks.bench_lazy
+
+Each sample request is logged at DEBUG through logger.debug("%s", ...) with the
+command built eagerly by to_curl() or deferred by lazy(), once with the logger
+at INFO — the record is dropped — and once at DEBUG with a handler writing to
+a null stream, so the record is formatted and emitted.
+"""
+
+import io
+import logging
+import timeit
+
+from collections.abc import Callable
+
+from benchmarks._samples import SYNC_SAMPLES, build
+from curlify3 import lazy, to_curl
+
+NUMBER = 20_000
+
+
+class _NullStream(io.TextIOBase):
+    def write(
+        self,
+        data: str,
+    ) -> int:
+        return len(data)
+
+
+def per_call(
+    run: Callable[[], object],
+) -> float:
+    return timeit.timeit(run, number=NUMBER) / NUMBER * 1e9
+
+
+if __name__ == "__main__":
+    logger = logging.getLogger("benchmarks.lazy")
+    logger.addHandler(logging.StreamHandler(_NullStream()))
+    logger.propagate = False
+    print(f"{'':<16} {'dropped, ns':>23} {'emitted, ns':>23}")
+    print(f"{'':<16} {'eager':>11} {'lazy':>11} {'eager':>11} {'lazy':>11}")
+    for name, request in build(SYNC_SAMPLES).items():
+        timings = []
+        for level in (logging.INFO, logging.DEBUG):
+            logger.setLevel(level)
+            timings.append(per_call(lambda request=request: logger.debug("%s", to_curl(request))))
+            timings.append(per_call(lambda request=request: logger.debug("%s", lazy(request))))
+        print(f"{name:<16} " + " ".join(f"{timing:>11.0f}" for timing in timings))
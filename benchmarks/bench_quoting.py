@@ -0,0 +1,102 @@
+"""Quoting throughput per dialect over ascii, utf-8 and binary inputs.
+
+    python -m benchmarks.bench_quoting [--max-size 104857600] [--reference]
+
+Sizes run from 1 KiB up to --max-size in steps of ten. Text inputs go through
+the text quote functions, and their utf-8 encoding through quote_sh_bytes (the
+mis-encoded text case); binary inputs only through quote_sh_bytes, the one
+function that can spell them. --reference also times the per-byte generator
+and callback-substitution implementations the tables replaced.
+"""
+
+import argparse
+import os
+import re
+import timeit
+
+from collections.abc import Callable
+from functools import partial
+
+from curlify3._curl import quote_powershell, quote_sh, quote_sh_bytes, quote_sh_word
+
+KIB = 1024
+PS_QUOTE = re.compile(r'(\\*)"')
+PS_TRAILING_BACKSLASHES = re.compile(r"\\+$")
+
+
+def reference_quote_sh_bytes(
+    value: bytes,
+) -> str:
+    def escape(
+        byte: int,
+    ) -> str:
+        if byte == 0x27:
+            return "\\'"
+        if byte == 0x5C:
+            return "\\\\"
+        if 0x20 <= byte <= 0x7E:
+            return chr(byte)
+        return f"\\x{byte:02x}"
+
+    return "$'" + "".join(escape(byte) for byte in value) + "'"
+
+
+def reference_quote_powershell(
+    value: str,
+) -> str:
+    quoted = PS_QUOTE.sub(lambda matched: matched.group(1) * 2 + '\\"', value)
+    quoted = PS_TRAILING_BACKSLASHES.sub(lambda matched: matched.group() * 2, quoted)
+    return f'"{quoted}"'
+
+
+def make_inputs(
+    size: int,
+) -> dict[str, str | bytes]:
+    # json-ish text with the characters every dialect has to escape
+    ascii_text = ('{"name": "O\'Brien", "path": "C:\\\\x"} ' * (size // 36 + 1))[:size]
+    utf8_text = ("{\"имя\": \"Zoë\", 'ключ': \"值\"} " * (size // 40 + 1))[:size]
+    return {"ascii": ascii_text, "utf-8": utf8_text, "binary": os.urandom(size)}
+
+
+def measure(
+    run: Callable[[], str],
+    size: int,
+) -> float:
+    number = max(1, 2**24 // size)
+    return min(timeit.repeat(run, number=number, repeat=3)) / number
+
+
+def main(
+    max_size: int,
+    reference: bool,
+) -> None:
+    text_quotes: dict[str, Callable[[str], str]] = {
+        "sh": quote_sh,
+        "sh word": quote_sh_word,
+        "powershell": quote_powershell,
+    }
+    bytes_quotes: dict[str, Callable[[bytes], str]] = {"sh bytes": quote_sh_bytes}
+    if reference:
+        text_quotes["powershell (ref)"] = reference_quote_powershell
+        bytes_quotes["sh bytes (ref)"] = reference_quote_sh_bytes
+    print(f"{'dialect':<18} {'input':<8} {'size':>10} {'ms':>10} {'MiB/s':>10}")
+    size = KIB
+    while size <= max_size:
+        for kind, value in make_inputs(size).items():
+            runs: list[tuple[str, Callable[[], str]]] = []
+            if isinstance(value, str):
+                runs += [(name, partial(quote, value)) for name, quote in text_quotes.items()]
+                value = value.encode()
+            runs += [(name, partial(quote, value)) for name, quote in bytes_quotes.items()]
+            for name, run in runs:
+                seconds = measure(run, size)
+                print(f"{name:<18} {kind:<8} {size:>10} {seconds * 1e3:>10.3f} {size / seconds / 2**20:>10.1f}")
+        size *= 10
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-size", type=int, default=100 * 2**20)
+    parser.add_argument("--reference", action="store_true")
+    arguments = parser.parse_args()
+    main(arguments.max_size, arguments.reference)
@@ -0,0 +1,41 @@
+"""Rendering a captured request: a shared Renderer against per-call resolution.
+
+    python -m benchmarks.bench_renderer
+
+Per call builds a Renderer for every command, which is the validation and the
+SHELLS / options lookup make_curl_string did before the options were resolved
+once. Shared is one Renderer built up front, the way a logging middleware
+holds it; to_curl-style is render(), which looks the shared one up by options.
+Only rendering is timed: the snapshot is captured once per sample.
+"""
+
+import timeit
+
+from benchmarks._samples import SYNC_SAMPLES, build
+from curlify3 import POWERSHELL, SH, Renderer, RequestSnapshot, render, snapshot
+
+NUMBER = 50_000
+CONFIGURATIONS = [(SH, False, False), (SH, True, True), (POWERSHELL, False, False)]
+
+
+def report(
+    captured: RequestSnapshot,
+    shell: str,
+    pretty: bool,
+    long_options: bool,
+) -> None:
+    renderer = Renderer(shell, pretty, long_options)
+    per_call = timeit.timeit(lambda: Renderer(shell, pretty, long_options).render_snapshot(captured), number=NUMBER)
+    shared = timeit.timeit(lambda: renderer.render_snapshot(captured), number=NUMBER)
+    looked_up = timeit.timeit(lambda: render(captured, shell, pretty, long_options), number=NUMBER)
+    name = f"{shell} pretty={pretty:d} long={long_options:d}"
+    print(
+        f"{name:<28} {per_call / NUMBER * 1e9:>13.0f} {shared / NUMBER * 1e9:>11.0f} {looked_up / NUMBER * 1e9:>13.0f}"
+    )
+
+
+if __name__ == "__main__":
+    captured = snapshot(build(SYNC_SAMPLES)["requests"])
+    print(f"{'configuration':<28} {'per call, ns':>13} {'shared, ns':>11} {'render(), ns':>13}")
+    for shell, pretty, long_options in CONFIGURATIONS:
+        report(captured, shell, pretty, long_options)
@@ -0,0 +1,56 @@
+"""Peak memory of writing a command with a large body to a binary sink.
+
+    python -m benchmarks.bench_writer [--size 52428800]
+
+The request carries a text body of --size bytes, and the command goes to a
+binary file the way a log sink writes it. The peak is what tracemalloc sees
+above the request itself while the command is rendered and written: once as
+stream.write(to_curl(request).encode()), once through to_curl_into(). Both
+include the decoded copy of the body the adapter makes when it captures it.
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+
+from collections.abc import Callable
+
+import requests
+
+from curlify3 import to_curl, to_curl_into
+
+
+def measure(
+    render: Callable[[], object],
+) -> tuple[float, int]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    render()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(
+    size: int,
+) -> None:
+    # quotes in the body, so that the sh quoting has something to escape
+    body = (b'{"note": "it\'s here", "pad": "' + b"x" * 80 + b'"}\n') * (size // 120)
+    request = requests.Request("POST", "https://httpbin.org/post", data=body).prepare()
+    with open(os.devnull, "wb") as sink:
+        print(f"body: {len(body) / 2**20:.1f} MiB")
+        print(f"{'':<24} {'ms':>10} {'peak, MiB':>10}")
+        for title, run in [
+            ("to_curl().encode()", lambda: sink.write(to_curl(request).encode())),
+            ("to_curl_into()", lambda: to_curl_into(request, sink)),
+        ]:
+            elapsed, peak = measure(run)
+            print(f"{title:<24} {elapsed * 1e3:>10.1f} {peak / 2**20:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=50 * 2**20)
+    main(parser.parse_args().size)
@@ -8,14 +8,59 @@
 
 Every supported request type goes through to_curl() (sync) or to_curl_async() (async);
 the docstring of each curlify3._req_* module carries an example for its library.
+Around those two:
+
+- snapshot() / snapshot_async() capture a RequestSnapshot that render() renders later,
+  elsewhere or more than once;
+- a Renderer fixes the output options once for a process that renders many commands
+  the same way, optionally with a FragmentCache of quoted headers;
+- to_curl_many() / to_curl_many_async() render a whole batch;
+- to_curl_into() / to_curl_into_async() write a command into a stream as it is rendered;
+- lazy() / lazy_async() defer rendering until a log record is actually emitted, and a
+  CurlQueueHandler emits it on a background thread.
 """
 
-from curlify3._curl import POWERSHELL, SH, to_curl, to_curl_async
+from curlify3._cache import FragmentCache, FragmentCacheInfo
+from curlify3._curl import (
+    POWERSHELL,
+    SH,
+    Renderer,
+    RenderError,
+    render,
+    snapshot,
+    snapshot_async,
+    to_curl,
+    to_curl_async,
+    to_curl_into,
+    to_curl_into_async,
+    to_curl_many,
+    to_curl_many_async,
+)
+from curlify3._lazy import LazyCurl, lazy, lazy_async
+from curlify3._logging import CurlQueueHandler
+from curlify3._types import FormPart, RequestSnapshot
 
 __version__ = "0.1.0"
 __all__ = [
     "POWERSHELL",
     "SH",
+    "CurlQueueHandler",
+    "FormPart",
+    "FragmentCache",
+    "FragmentCacheInfo",
+    "LazyCurl",
+    "RenderError",
+    "Renderer",
+    "RequestSnapshot",
+    "lazy",
+    "lazy_async",
+    "render",
+    "snapshot",
+    "snapshot_async",
     "to_curl",
     "to_curl_async",
+    "to_curl_into",
+    "to_curl_into_async",
+    "to_curl_many",
+    "to_curl_many_async",
 ]
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import Any, ClassVar, Generic, TypeVar, cast
 
-from curlify3._types import Body, Headers, RawRequest
+from curlify3._types import Body, Headers, RawRequest, RequestSnapshot
 
 RequestT = TypeVar("RequestT", bound=RawRequest)
 
@@ -42,28 +43,55 @@ class _RequestData(ABC, Generic[RequestT]):
     ) -> str:
         return self._request.method
 
+    def _header_items(
+        self,
+    ) -> Iterable[tuple[Any, Any]]:
+        # the container's own items() rather than dict() of it: dict() goes through keys() and
+        # a lookup per key, which for a list-backed container is a scan per key. A multidict
+        # repeats a name here where dict() would have kept the first value, and so does
+        # _split_headers below
+        return self._request.headers.items()
+
+    def _split_headers(
+        self,
+    ) -> tuple[Headers, str | None]:
+        # one pass over the wrapped container for both: the headers, and the cookie header
+        # that travels as -b instead. Scanned rather than looked up: not every wrapped
+        # container is case-insensitive (tornado's client request keeps whatever plain dict
+        # it was handed), and the headers already trust dict() alone
+        headers: Headers = {}
+        cookies = None
+        for name, value in self._header_items():
+            name = name.lower()
+            if name == "cookie":
+                if cookies is None:
+                    cookies = value if value.__class__ is str else _header_value(value)
+            elif name not in headers:
+                # text is by far the common value, and needs no call to stay what it is
+                headers[name] = value if value.__class__ is str else _header_value(value)
+        return headers, cookies
+
     @property
     def headers(
         self,
     ) -> Headers:
-        headers = {name.lower(): _header_value(value) for name, value in dict(self._request.headers).items()}
-        # dropped even when empty: a value, when there is one, travels as -b
-        # instead, and an empty cookie header carries nothing worth repeating
-        # (django's RequestFactory sets one on every request it builds)
-        headers.pop("cookie", None)
-        return headers
+        # the cookie header is dropped even when empty: a value, when there is one, travels
+        # as -b instead, and an empty cookie header carries nothing worth repeating (django's
+        # RequestFactory sets one on every request it builds)
+        return self._split_headers()[0]
 
     @property
     def cookies(
         self,
     ) -> str | None:
-        # scanned rather than looked up: not every wrapped container is
-        # case-insensitive (tornado's client request keeps whatever plain dict
-        # it was handed), and the headers property already trusts dict() alone
-        for name, value in dict(self._request.headers).items():
-            if name.lower() == "cookie":
-                return _header_value(value)
-        return None
+        return self._split_headers()[1]
+
+    def _snapshot(
+        self,
+        body: Body,
+    ) -> RequestSnapshot:
+        headers, cookies = self._split_headers()
+        return RequestSnapshot(self.method, self.url, tuple(headers.items()), cookies, body, self.http2)
 
 
 # the sync and async bases are siblings on purpose: an async body() cannot
@@ -75,6 +103,11 @@ class BaseRequestData(_RequestData[RequestT], ABC):
     ) -> Body:
         raise NotImplementedError
 
+    def snapshot(
+        self,
+    ) -> RequestSnapshot:
+        return self._snapshot(self.body())
+
 
 class AsyncBaseRequestData(_RequestData[RequestT], ABC):
     @abstractmethod
@@ -82,3 +115,8 @@ class AsyncBaseRequestData(_RequestData[RequestT], ABC):
         self,
     ) -> Body:
         raise NotImplementedError
+
+    async def snapshot(
+        self,
+    ) -> RequestSnapshot:
+        return self._snapshot(await self.body())
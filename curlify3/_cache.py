@@ -0,0 +1,83 @@
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from typing import NamedTuple
+
+
+class FragmentCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    size: int
+
+    @property
+    def hit_rate(
+        self,
+    ) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def make_fragment(
+    option: str,
+    quote: Callable[[str], str],
+    name: str | None,
+    value: str,
+) -> str:
+    # a header line is quoted as a whole, name included; the cookie header has no name of its
+    # own on the command line, only the option that carries it
+    return f"{option} {quote(value if name is None else f'{name}: {value}')}"
+
+
+class FragmentCache:
+    """A bounded LRU cache of quoted header and cookie arguments.
+
+    Hand one to Renderer(fragment_cache=...) and the header lines and cookie
+    headers a service sends over and over are quoted once instead of on every
+    command. An entry is keyed by the option spelling and the quote function of
+    the dialect as well as by the header, so one cache can be shared by
+    renderers of different dialects and option styles. The least recently used
+    entry is evicted past maxsize, which keeps per-request values such as
+    request ids from growing the cache; info() reports how well it is doing.
+
+    A miss costs more than quoting without a cache, so the cache pays off only
+    at a high hit rate. Header names in skip_headers — the ones whose value is
+    new on every request, such as x-request-id — are quoted directly and never
+    take up an entry.
+    """
+
+    __slots__ = ("fragment", "maxsize", "skip_headers")
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        skip_headers: Iterable[str] = (),
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be a positive number of entries, got {maxsize!r}")
+        self.maxsize = maxsize
+        # matched against the lowercased names the adapters hand over
+        self.skip_headers = frozenset(name.lower() for name in skip_headers)
+        # fragment(option, quote, name, value) renders one argument, name None for the cookie
+        # header. lru_cache is the LRU in C and thread-safe — a renderer is shared by every
+        # thread that logs — and is bound as is: a lock of our own around an OrderedDict, or
+        # even a method wrapping the call, cost about as much as the quoting saved
+        self.fragment = lru_cache(maxsize=maxsize)(make_fragment)
+
+    def __repr__(
+        self,
+    ) -> str:
+        return f"FragmentCache(maxsize={self.maxsize!r}, skip_headers={sorted(self.skip_headers)!r})"
+
+    def info(
+        self,
+    ) -> FragmentCacheInfo:
+        info = self.fragment.cache_info()
+        # every miss stores an entry and only eviction removes one short of clear(), which
+        # resets the counters with the entries, so whatever misses did not stay was evicted
+        return FragmentCacheInfo(info.hits, info.misses, info.misses - info.currsize, self.maxsize, info.currsize)
+
+    def clear(
+        self,
+    ) -> None:
+        self.fragment.cache_clear()
@@ -1,9 +1,14 @@
+import asyncio
+import io
 import re
 
-from collections.abc import Callable, Iterator, Mapping
-from typing import Final, NamedTuple, TypeAlias
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import cache
+from itertools import chain
+from typing import Any, Final, Literal, NamedTuple, Protocol, TypeAlias, overload
 
-from curlify3._types import Body, Headers
+from curlify3._cache import FragmentCache, make_fragment
+from curlify3._types import Body, FormPart, Headers, RequestSnapshot
 from curlify3._utils import make_request_obj, make_request_obj_async
 
 # a body that did not decode never reaches a text quote function: it goes through
@@ -11,6 +16,19 @@ from curlify3._utils import make_request_obj, make_request_obj_async
 Quote: TypeAlias = Callable[[str], str]
 BytesQuote: TypeAlias = Callable[[bytes], str]
 Options: TypeAlias = Mapping[str, str]
+# the same quoting, produced a chunk of the value at a time for the stream writers
+ChunkedQuote: TypeAlias = Callable[[str, int], Iterator[str]]
+ChunkedBytesQuote: TypeAlias = Callable[[bytes, int], Iterator[str]]
+
+
+class Stream(Protocol):
+    # where the stream writers put a command: text when it is an io.TextIOBase, bytes otherwise
+    def write(
+        self,
+        data: Any,  # noqa: ANN401
+        /,
+    ) -> object: ...
+
 
 MULTIPART_BOUNDARY: Final = re.compile(r'boundary="?([^";]+)"?')
 PART_NAME: Final = re.compile(rb'name="([^"]*)"')
@@ -24,15 +42,22 @@ PART_FILENAME: Final = re.compile(rb'filename="([^"]*)"')
 DATA_FILE_REF: Final = "@"
 FORM_FILE_REF: Final = (b"@", b"<")
 
-PS_QUOTE: Final = re.compile(r'(\\*)"')
-PS_TRAILING_BACKSLASHES: Final = re.compile(r"\\+$")
-
 # the character class shlex.quote() treats as safe: no shell metacharacter, no glob
 # character, no whitespace. A value holding anything else is quoted, which still leaves
 # a plain url and a lone cookie pair bare and keeps the common command terse
 SH_UNSAFE: Final = re.compile(r"[^\w@%+=:,./-]", re.ASCII)
 # inside $'...' these two are the only characters that carry meaning
 SH_BYTE_ESCAPES: Final[Mapping[int, str]] = {0x27: "\\'", 0x5C: "\\\\"}
+# how every byte is spelled inside $'...', indexed by the byte and applied through
+# str.translate over the latin-1 decoding of the value, which maps each byte to the
+# code point of the same number: printable ascii as itself, the two characters
+# above escaped, everything else as \xNN
+SH_BYTES_TABLE: Final[Mapping[int, str]] = {
+    byte: SH_BYTE_ESCAPES.get(byte, chr(byte) if 0x20 <= byte <= 0x7E else f"\\x{byte:02x}") for byte in range(256)
+}
+
+# how much of a body the stream writers quote, and how much output they gather, per write
+WRITE_CHUNK: Final = 64 * 1024
 
 SH: Final = "sh"
 POWERSHELL: Final = "powershell"
@@ -77,23 +102,38 @@ def quote_sh_word(
     return quote_sh(value) if SH_UNSAFE.search(value) else value
 
 
-def _escape_sh_byte(
-    byte: int,
-) -> str:
-    if byte in SH_BYTE_ESCAPES:
-        return SH_BYTE_ESCAPES[byte]
-    if 0x20 <= byte <= 0x7E:
-        return chr(byte)
-    return f"\\x{byte:02x}"
-
-
 def quote_sh_bytes(
     value: bytes,
 ) -> str:
     # $'...' is ANSI-C quoting: bash, zsh and ksh expand the escapes, POSIX sh does not.
     # Escaping only the bytes that have to be escaped keeps a mis-encoded text body legible,
     # and leaves the command pure ascii with no newline in it, which pretty output relies on
-    return "$'" + "".join(_escape_sh_byte(byte) for byte in value) + "'"
+    return "$'" + value.decode("latin-1").translate(SH_BYTES_TABLE) + "'"
+
+
+def iter_quote_sh(
+    value: str,
+    size: int,
+) -> Iterator[str]:
+    # the quote is a single character, so a chunk boundary never splits one and every chunk
+    # is escaped exactly as it would be as part of the whole value
+    yield "'"
+    for start in range(0, len(value), size):
+        yield value[start : start + size].replace("'", "'\\''")
+    yield "'"
+
+
+def iter_quote_sh_bytes(
+    value: bytes,
+    size: int,
+) -> Iterator[str]:
+    # the table maps byte by byte, so any chunk boundary will do; decoding a view of the
+    # chunk copies nothing but the chunk's own text
+    view = memoryview(value)
+    yield "$'"
+    for start in range(0, len(value), size):
+        yield str(view[start : start + size], "latin-1").translate(SH_BYTES_TABLE)
+    yield "'"
 
 
 def quote_powershell(
@@ -102,9 +142,17 @@ def quote_powershell(
     # the command is emitted behind the --% stop-parsing token, so the only parser left is the
     # C runtime of curl.exe: wrap in "...", escape " as \" doubling any run of backslashes
     # directly before it, and double a trailing run so it cannot swallow the closing quote
-    quoted = PS_QUOTE.sub(lambda matched: matched.group(1) * 2 + '\\"', value)
-    quoted = PS_TRAILING_BACKSLASHES.sub(lambda matched: matched.group() * 2, quoted)
-    return f'"{quoted}"'
+    if "\\" not in value:
+        # no backslash, no run to double: the common JSON body stays a single replace
+        return '"' + value.replace('"', '\\"') + '"'
+    # every piece but the last is followed by a quote, and the last by the closing one, so a
+    # run of backslashes at the end of any piece is exactly a run the C runtime would read
+    # as escaping the quote after it
+    pieces = value.split('"')
+    for index, piece in enumerate(pieces):
+        if piece.endswith("\\"):
+            pieces[index] = piece + "\\" * (len(piece) - len(piece.rstrip("\\")))
+    return '"' + '\\"'.join(pieces) + '"'
 
 
 def quote_powershell_bytes(
@@ -127,10 +175,14 @@ class ShellConfig(NamedTuple):
     quote_bytes: BytesQuote
     # what separates arguments in pretty mode, None when the shell cannot span lines
     pretty_separator: str | None
+    # quote and quote_bytes a chunk at a time, for a body written into a stream; None when a
+    # chunk boundary could change the quoting and the body is quoted whole
+    iter_quote: ChunkedQuote | None = None
+    iter_quote_bytes: ChunkedBytesQuote | None = None
 
 
 SHELLS: Final[Mapping[str, ShellConfig]] = {
-    SH: ShellConfig("curl", "", quote_sh, quote_sh_word, quote_sh_bytes, " \\\n  "),
+    SH: ShellConfig("curl", "", quote_sh, quote_sh_word, quote_sh_bytes, " \\\n  ", iter_quote_sh, iter_quote_sh_bytes),
     # --% is the stop-parsing token: Windows PowerShell 5.1 (the dialect's target) hands
     # everything after it to curl.exe verbatim (only %VAR% references expand), leaving the
     # C runtime as the single parser — 5.1's own argument binder re-quotes by counting every
@@ -140,7 +192,9 @@ SHELLS: Final[Mapping[str, ShellConfig]] = {
     # the url and cookies are always quoted to keep whitespace safe for the C runtime parser
     # pretty is impossible here: --% is effective only until the next newline and the line
     # continuation character (`) cannot extend it (about_Parsing), so a multi-line command
-    # would pass the backtick to curl.exe and run the next line on its own
+    # would pass the backtick to curl.exe and run the next line on its own. Nor is the body
+    # quoted in chunks: a run of backslashes straddling a boundary is doubled or not depending
+    # on what follows it
     POWERSHELL: ShellConfig("curl.exe", "--%", quote_powershell, quote_powershell, quote_powershell_bytes, None),
 }
 
@@ -198,15 +252,65 @@ def quote_multipart_part(
 def split_multipart_body(
     body: bytes,
     boundary: bytes,
-) -> Iterator[tuple[bytes, bytes]]:
+) -> Iterator[tuple[bytes, memoryview]]:
     # a part is --boundary CRLF headers CRLF CRLF value CRLF, and the body is closed by
     # --boundary--, whose chunk carries no CRLF CRLF and so drops out below. Splitting on the
     # delimiter the sender chose is what lets a value hold a CRLF of its own: matching a
-    # value as one line truncated it there, and the command sent the prefix without a word
-    for chunk in body.split(b"--" + boundary)[1:]:
-        head, separator, value = chunk.partition(b"\r\n\r\n")
-        if separator:
-            yield head, value.removesuffix(b"\r\n")
+    # value as one line truncated it there, and the command sent the prefix without a word.
+    # The body is walked by offset rather than split: an upload is mostly file parts whose
+    # value is never rendered, so only the headers are copied and every value stays a view
+    delimiter = b"--" + boundary
+    view = memoryview(body)
+    start = body.find(delimiter)
+    while start != -1:
+        start += len(delimiter)
+        end = body.find(delimiter, start)
+        chunk_end = len(body) if end == -1 else end
+        separator = body.find(b"\r\n\r\n", start, chunk_end)
+        if separator != -1:
+            value_start = separator + 4
+            value_end = chunk_end
+            if value_end - value_start >= 2 and body.startswith(b"\r\n", value_end - 2):
+                value_end -= 2
+            yield body[start:separator], view[value_start:value_end]
+        start = end
+
+
+def make_form_part(
+    head: bytes,
+    value: bytes | memoryview | None,
+) -> FormPart | None:
+    # the name and the filename are read off the part headers the way they were written to
+    # the wire — escapes included — whether the headers came out of the body or out of the
+    # library that would have encoded it. A part without a name has nothing to render
+    name = PART_NAME.search(head)
+    if name is None:
+        return None
+    filename = PART_FILENAME.search(head)
+    return FormPart(name.group(1), value, None if filename is None else filename.group(1))
+
+
+def make_form_curl_args(
+    parts: Iterable[FormPart],
+    quote: Quote,
+    quote_bytes: BytesQuote,
+    options: Options,
+) -> list[str]:
+    body_parts = []
+    for part in parts:
+        if part.is_file:
+            # here the leading @ is the point: -F is what makes curl send the file the
+            # request sent, so a file part is spelled name=@filename
+            argument, option = part.name + b"=@" + (part.filename or b""), options["form"]
+        else:
+            # the value of a plain field is a literal, so --form-string as soon as it begins
+            # with a character -F would read as a file reference. -F stays the common case: it
+            # is the terser option and the value rarely begins with either character
+            value = part.value or b""
+            argument = part.name + b"=" + value
+            option = options["form_string"] if bytes(value[:1]) in FORM_FILE_REF else options["form"]
+        body_parts.append(f"{option} {quote_multipart_part(argument, quote, quote_bytes)}")
+    return body_parts
 
 
 def make_multipart_curl_args(
@@ -223,24 +327,21 @@ def make_multipart_curl_args(
     if boundary is None:
         return []
     body = body.encode() if isinstance(body, str) else body
-    body_parts = []
-    for head, value in split_multipart_body(body, boundary.group(1).encode()):
-        name = PART_NAME.search(head)
-        if name is None:
-            continue
-        filename = PART_FILENAME.search(head)
-        if filename is not None:
-            # here the leading @ is the point: -F is what makes curl send the file the
-            # request sent, so a file part is spelled name=@filename
-            part, option = name.group(1) + b"=@" + filename.group(1), options["form"]
-        else:
-            # the value of a plain field is a literal, so --form-string as soon as it begins
-            # with a character -F would read as a file reference. -F stays the common case: it
-            # is the terser option and the value rarely begins with either character
-            part = name.group(1) + b"=" + value
-            option = options["form_string"] if value.startswith(FORM_FILE_REF) else options["form"]
-        body_parts.append(f"{option} {quote_multipart_part(part, quote, quote_bytes)}")
-    return body_parts
+    parts = (make_form_part(head, value) for head, value in split_multipart_body(body, boundary.group(1).encode()))
+    return make_form_curl_args(filter(None, parts), quote, quote_bytes, options)
+
+
+def data_option(
+    body: str | bytes,
+    options: Options,
+) -> str:
+    if isinstance(body, bytes):
+        # the adapter could not decode it. --data-raw rather than --data, because both --data
+        # and --data-binary read a leading @ as a filename, and @ is an ordinary byte here
+        return options["data_raw"]
+    # the same file reference, in a body that did decode: --data would send the contents of
+    # the named file instead of the body the request carried
+    return options["data_raw"] if body.startswith(DATA_FILE_REF) else options["data"]
 
 
 def make_curl_body(
@@ -253,6 +354,10 @@ def make_curl_body(
     # an absent body carries no arguments whatever the content-type claims
     if not body:
         return []
+    # the adapter had the form as fields and never encoded it, so there is nothing to take
+    # apart: the parts render the way the parts of an encoded body do
+    if isinstance(body, tuple):
+        return make_form_curl_args(body, quote, quote_bytes, options)
     # multipart comes first: such a body arrives as bytes whenever one of its file parts
     # is binary, and the parts are taken apart and rendered individually below — each with
     # its own NUL check, since only part of such a body reaches the command line
@@ -260,14 +365,383 @@ def make_curl_body(
     if "multipart" in content_type:
         return make_multipart_curl_args(body, content_type, quote, quote_bytes, options)
     reject_nul(body, "body")
-    if isinstance(body, bytes):
-        # the adapter could not decode it. --data-raw rather than --data, because both --data
-        # and --data-binary read a leading @ as a filename, and @ is an ordinary byte here
-        return [f"{options['data_raw']} {quote_bytes(body)}"]
-    # the same file reference, in a body that did decode: --data would send the contents of
-    # the named file instead of the body the request carried
-    option = options["data_raw"] if body.startswith(DATA_FILE_REF) else options["data"]
-    return [f"{option} {quote(body)}"]
+    return [f"{data_option(body, options)} {quote_bytes(body) if isinstance(body, bytes) else quote(body)}"]
+
+
+def iter_blocks(
+    fragments: Iterable[str],
+    text: bool,
+) -> Iterator[str] | Iterator[bytes]:
+    # a command is mostly small fragments — an option, a space, a header — and a stream that
+    # is not buffered, a socket's say, would take a system call for each: they are gathered
+    # into blocks of about WRITE_CHUNK instead, encoded one block at a time for a binary stream
+    buffer: list[str] = []
+    size = 0
+    for fragment in fragments:
+        buffer.append(fragment)
+        size += len(fragment)
+        if size >= WRITE_CHUNK:
+            block = "".join(buffer)
+            buffer.clear()
+            size = 0
+            yield block if text else block.encode()
+    if buffer:
+        block = "".join(buffer)
+        yield block if text else block.encode()
+
+
+class RenderError(ValueError):
+    """A request of a batch that could not be rendered.
+
+    index is its position in the batch and request the object itself; the
+    exception it raised is chained as __cause__.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        request: object,
+        error: Exception,
+    ) -> None:
+        super().__init__(f"request {index} of the batch cannot be rendered: {error}")
+        self.index = index
+        self.request = request
+
+
+class Renderer:
+    """Render requests as curl commands in one fixed dialect and layout.
+
+    The shell, pretty and long_options arguments, and the ValueError they raise,
+    are those of to_curl(); they are validated once, here, rather than on every
+    command. A renderer holds no state beyond them, so one built at startup can
+    be shared by every thread and every task of the process.
+
+    fragment_cache, when given, serves the quoted header and cookie arguments
+    from a FragmentCache instead of quoting them for every command.
+    """
+
+    __slots__ = (
+        "_fragment_cache",
+        "_iter_quote",
+        "_iter_quote_bytes",
+        "_options",
+        "_prefix",
+        "_quote",
+        "_quote_bytes",
+        "_quote_word",
+        "_separator",
+        "long_options",
+        "pretty",
+        "shell",
+    )
+
+    def __init__(
+        self,
+        shell: str = SH,
+        pretty: bool = False,
+        long_options: bool = False,
+        fragment_cache: FragmentCache | None = None,
+    ) -> None:
+        if shell not in SHELLS:
+            raise ValueError(f"unknown shell: {shell!r}, expected one of {sorted(SHELLS)}")
+        shell_conf = SHELLS[shell]
+        # non-None only when the output is asked to span lines and the shell can
+        separator = shell_conf.pretty_separator if pretty else None
+        if pretty and separator is None:
+            raise ValueError(f"pretty output is not supported for shell: {shell!r}")
+        # the other two rejections live in SHELLS, in the quote functions of the dialect that
+        # cannot render the value: a NUL byte in any shell, and raw bytes in powershell
+        self.shell = shell
+        self.pretty = pretty
+        self.long_options = long_options
+        self._options = LONG_OPTIONS if long_options else SHORT_OPTIONS
+        self._quote = shell_conf.quote
+        self._quote_word = shell_conf.quote_word
+        self._quote_bytes = shell_conf.quote_bytes
+        self._iter_quote = shell_conf.iter_quote
+        self._iter_quote_bytes = shell_conf.iter_quote_bytes
+        self._separator = separator
+        self._fragment_cache = fragment_cache
+        self._prefix = " ".join([part for part in (shell_conf.binary, shell_conf.args_prefix) if part])
+
+    def __repr__(
+        self,
+    ) -> str:
+        return (
+            f"Renderer(shell={self.shell!r}, pretty={self.pretty!r}, long_options={self.long_options!r}, "
+            f"fragment_cache={self._fragment_cache!r})"
+        )
+
+    def render(
+        self,
+        request: object,
+    ) -> str:
+        """Render a request object to_curl() accepts."""
+        return self.render_snapshot(snapshot(request))
+
+    async def arender(
+        self,
+        request: object,
+    ) -> str:
+        """Render a request object to_curl_async() accepts, awaiting the body."""
+        return self.render_snapshot(await snapshot_async(request))
+
+    @overload
+    def render_many(
+        self,
+        requests: Iterable[object],
+        skip_errors: Literal[False] = False,
+    ) -> list[str]: ...
+
+    @overload
+    def render_many(
+        self,
+        requests: Iterable[object],
+        *,
+        skip_errors: bool,
+    ) -> list[str | None]: ...
+
+    def render_many(
+        self,
+        requests: Iterable[object],
+        skip_errors: bool = False,
+    ) -> list[str] | list[str | None]:
+        """Render a batch of request objects to_curl() accepts, in order.
+
+        A request that fails raises RenderError, or leaves None in its place
+        with skip_errors=True.
+        """
+        commands: list[str | None] = []
+        for index, request in enumerate(requests):
+            try:
+                commands.append(self.render_snapshot(make_request_obj(request).snapshot()))
+            except Exception as error:
+                if not skip_errors:
+                    raise RenderError(index, request, error) from error
+                commands.append(None)
+        return commands
+
+    @overload
+    async def arender_many(
+        self,
+        requests: Iterable[object],
+        concurrency: int = ...,
+        skip_errors: Literal[False] = False,
+    ) -> list[str]: ...
+
+    @overload
+    async def arender_many(
+        self,
+        requests: Iterable[object],
+        concurrency: int = ...,
+        *,
+        skip_errors: bool,
+    ) -> list[str | None]: ...
+
+    async def arender_many(
+        self,
+        requests: Iterable[object],
+        concurrency: int = 16,
+        skip_errors: bool = False,
+    ) -> list[str] | list[str | None]:
+        """Render a batch of request objects to_curl_async() accepts, in order.
+
+        Up to concurrency bodies are awaited at a time. A request that fails
+        raises RenderError, or leaves None in its place with skip_errors=True.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be a positive number of requests, got {concurrency!r}")
+        requests = list(requests)
+        commands: list[str | None] = [None] * len(requests)
+        # a fixed pool of workers drawing from one iterator rather than a task per request:
+        # a batch of tens of thousands costs concurrency tasks, and the iterator needs no lock
+        # because the workers only switch at an await
+        pending = enumerate(requests)
+
+        async def worker() -> None:
+            for index, request in pending:
+                try:
+                    commands[index] = self.render_snapshot(await make_request_obj_async(request).snapshot())
+                except Exception as error:
+                    if not skip_errors:
+                        raise RenderError(index, request, error) from error
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(concurrency, len(requests)))]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            # the first failure ends the batch: the other workers are not left reading bodies
+            # nobody will render
+            for task in workers:
+                task.cancel()
+            raise
+        return commands
+
+    def render_into(
+        self,
+        request: object,
+        stream: Stream,
+    ) -> None:
+        """Render a request object to_curl() accepts into a stream, see to_curl_into()."""
+        self.render_snapshot_into(snapshot(request), stream)
+
+    async def arender_into(
+        self,
+        request: object,
+        stream: Stream,
+    ) -> None:
+        """Render a request object to_curl_async() accepts into a stream, see to_curl_into_async()."""
+        captured = await snapshot_async(request)
+        drain = getattr(stream, "drain", None)
+        for block in iter_blocks(self._iter_command(captured), isinstance(stream, io.TextIOBase)):
+            stream.write(block)
+            if drain is not None:
+                await drain()
+
+    def render_snapshot_into(
+        self,
+        snapshot: RequestSnapshot,
+        stream: Stream,
+    ) -> None:
+        """Render a captured request into a stream, see to_curl_into()."""
+        for block in iter_blocks(self._iter_command(snapshot), isinstance(stream, io.TextIOBase)):
+            stream.write(block)
+
+    def render_snapshot(
+        self,
+        snapshot: RequestSnapshot,
+    ) -> str:
+        """Render a captured request; the snapshot is left as it was."""
+        # the headers are edited below, and the snapshot's stay as captured
+        return self._make_curl_string(
+            method=snapshot.method,
+            url=snapshot.url,
+            headers=dict(snapshot.headers),
+            body=snapshot.body,
+            cookies=snapshot.cookies,
+            http2=snapshot.http2,
+        )
+
+    def _make_curl_cookies_and_headers(
+        self,
+        cookies: str | None,
+        headers: Headers,
+    ) -> list[str]:
+        options = self._options
+        if self._fragment_cache is None:
+            return [
+                *make_curl_cookies(cookies, self._quote_word, options),
+                *make_curl_headers(headers, self._quote, options),
+            ]
+        fragment, skip_headers = self._fragment_cache.fragment, self._fragment_cache.skip_headers
+        header_option, quote = options["header"], self._quote
+        args = [
+            (make_fragment if header in skip_headers else fragment)(header_option, quote, header, value)
+            for header, value in headers.items()
+        ]
+        if cookies:
+            args.insert(0, fragment(options["cookie"], self._quote_word, None, cookies))
+        return args
+
+    def _make_curl_args(
+        self,
+        method: str,
+        headers: Headers,
+        body: Body,
+        cookies: str | None,
+        http2: bool,
+    ) -> list[str]:
+        # every argument but the body's, which the string and the stream writers spell apart
+        if "content-length" in headers:
+            del headers["content-length"]
+        if body and isinstance(body, (str, bytes)) and not headers.get("content-type"):
+            headers["content-type"] = "text/plain"
+        args = [
+            "--http2" if http2 else None,
+            f"{self._options['request']} {method}" if method != "GET" else None,
+            *self._make_curl_cookies_and_headers(cookies, headers),
+        ]
+        return [entity for entity in args if entity]
+
+    def _make_curl_string(
+        self,
+        method: str,
+        url: str,
+        headers: Headers,
+        body: Body,
+        cookies: str | None,
+        http2: bool,
+    ) -> str:
+        parts = [
+            *self._make_curl_args(method, headers, body, cookies, http2),
+            *make_curl_body(body, headers, self._quote, self._quote_bytes, self._options),
+        ]
+        url = self._quote_word(url)
+        if self._separator is not None:
+            return self._separator.join([f"{self._prefix} {url}", *parts])
+        return " ".join([self._prefix, *parts, url])
+
+    def _iter_curl_body(
+        self,
+        body: Body,
+        headers: Headers,
+    ) -> list[Iterable[str]]:
+        iter_quote, iter_quote_bytes = self._iter_quote, self._iter_quote_bytes
+        # only a plain body can be large enough to matter and be quoted a chunk at a time; a
+        # form is rendered part by part anyway, and its file parts are not rendered at all
+        if (
+            iter_quote is None
+            or iter_quote_bytes is None
+            or not body
+            or not isinstance(body, (str, bytes))
+            or "multipart" in headers.get("content-type", "")
+        ):
+            return [(arg,) for arg in make_curl_body(body, headers, self._quote, self._quote_bytes, self._options)]
+        reject_nul(body, "body")
+        quoted = iter_quote_bytes(body, WRITE_CHUNK) if isinstance(body, bytes) else iter_quote(body, WRITE_CHUNK)
+        return [chain((data_option(body, self._options), " "), quoted)]
+
+    def _iter_command(
+        self,
+        snapshot: RequestSnapshot,
+    ) -> Iterator[str]:
+        # the command render_snapshot() returns, in fragments. Everything that can raise runs
+        # before the first one is yielded, so a command that cannot be rendered leaves nothing
+        # half-written behind
+        headers = dict(snapshot.headers)
+        args: list[Iterable[str]] = [
+            *[
+                (arg,)
+                for arg in self._make_curl_args(
+                    snapshot.method, headers, snapshot.body, snapshot.cookies, snapshot.http2
+                )
+            ],
+            *self._iter_curl_body(snapshot.body, headers),
+        ]
+        url = self._quote_word(snapshot.url)
+        if self._separator is not None:
+            yield f"{self._prefix} {url}"
+            for arg in args:
+                yield self._separator
+                yield from arg
+            return
+        yield self._prefix
+        for arg in args:
+            yield " "
+            yield from arg
+        yield " "
+        yield url
+
+
+@cache
+def get_renderer(
+    shell: str = SH,
+    pretty: bool = False,
+    long_options: bool = False,
+) -> Renderer:
+    # the renderers behind to_curl() and render(): there are only as many as there are valid
+    # combinations of the three, and a combination that raises is not cached
+    return Renderer(shell=shell, pretty=pretty, long_options=long_options)
 
 
 def make_curl_string(
@@ -281,33 +755,48 @@ def make_curl_string(
     pretty: bool = False,
     long_options: bool = False,
 ) -> str:
-    if shell not in SHELLS:
-        raise ValueError(f"unknown shell: {shell!r}, expected one of {sorted(SHELLS)}")
-    shell_conf = SHELLS[shell]
-    # non-None only when the output is asked to span lines and the shell can
-    separator = shell_conf.pretty_separator if pretty else None
-    if pretty and separator is None:
-        raise ValueError(f"pretty output is not supported for shell: {shell!r}")
-    # the other two rejections live in SHELLS, in the quote functions of the dialect that
-    # cannot render the value: a NUL byte in any shell, and raw bytes in powershell
-    options = LONG_OPTIONS if long_options else SHORT_OPTIONS
-    if "content-length" in headers:
-        del headers["content-length"]
-    if body and isinstance(body, (str, bytes)) and not headers.get("content-type"):
-        headers["content-type"] = "text/plain"
-    args = [
-        "--http2" if http2 else None,
-        f"{options['request']} {method}" if method != "GET" else None,
-        *make_curl_cookies(cookies, shell_conf.quote_word, options),
-        *make_curl_headers(headers, shell_conf.quote, options),
-        *make_curl_body(body, headers, shell_conf.quote, shell_conf.quote_bytes, options),
-    ]
-    parts = [str(entity) for entity in args if entity]
-    command = " ".join([part for part in (shell_conf.binary, shell_conf.args_prefix) if part])
-    url = shell_conf.quote_word(url)
-    if separator is not None:
-        return separator.join([f"{command} {url}", *parts])
-    return " ".join([command, *parts, url])
+    return get_renderer(shell, pretty, long_options)._make_curl_string(method, url, headers, body, cookies, http2)
+
+
+def snapshot(
+    request: object,
+) -> RequestSnapshot:
+    """Capture what a curl command is rendered from, in one pass over the request.
+
+    Accepts the request types to_curl() does. The snapshot is rendered with
+    render(); reading it never touches the request again.
+
+    Raises ValueError if the request type is not recognized.
+    """
+    return make_request_obj(request).snapshot()
+
+
+async def snapshot_async(
+    request: object,
+) -> RequestSnapshot:
+    """Capture what a curl command is rendered from, awaiting the body.
+
+    Accepts the request types to_curl_async() does. The snapshot is rendered
+    with render(); reading it never touches the request again.
+
+    Raises ValueError if the request type is not recognized.
+    """
+    return await make_request_obj_async(request).snapshot()
+
+
+def render(
+    snapshot: RequestSnapshot,
+    shell: str = SH,
+    pretty: bool = False,
+    long_options: bool = False,
+) -> str:
+    """Render a captured request as a curl command.
+
+    shell, pretty and long_options, and the ValueError contract apart from the
+    request type, are those of to_curl(). The snapshot is left as it was, so it
+    can be rendered again, in another dialect or on another thread.
+    """
+    return get_renderer(shell, pretty, long_options).render_snapshot(snapshot)
 
 
 def to_curl(
@@ -334,18 +823,7 @@ def to_curl(
     field value — is not valid UTF-8 and shell="powershell", or if either contains
     a NUL byte.
     """
-    data = make_request_obj(request)
-    return make_curl_string(
-        method=data.method,
-        url=data.url,
-        headers=data.headers,
-        body=data.body(),
-        cookies=data.cookies,
-        http2=data.http2,
-        shell=shell,
-        pretty=pretty,
-        long_options=long_options,
-    )
+    return get_renderer(shell, pretty, long_options).render(request)
 
 
 async def to_curl_async(
@@ -371,15 +849,121 @@ async def to_curl_async(
     field value — is not valid UTF-8 and shell="powershell", or if either contains
     a NUL byte.
     """
-    data = make_request_obj_async(request)
-    return make_curl_string(
-        method=data.method,
-        url=data.url,
-        headers=data.headers,
-        body=await data.body(),
-        cookies=data.cookies,
-        http2=data.http2,
-        shell=shell,
-        pretty=pretty,
-        long_options=long_options,
-    )
+    return await get_renderer(shell, pretty, long_options).arender(request)
+
+
+@overload
+def to_curl_many(
+    requests: Iterable[object],
+    shell: str = ...,
+    pretty: bool = ...,
+    long_options: bool = ...,
+    skip_errors: Literal[False] = False,
+) -> list[str]: ...
+
+
+@overload
+def to_curl_many(
+    requests: Iterable[object],
+    shell: str = ...,
+    pretty: bool = ...,
+    long_options: bool = ...,
+    *,
+    skip_errors: bool,
+) -> list[str | None]: ...
+
+
+def to_curl_many(
+    requests: Iterable[object],
+    shell: str = SH,
+    pretty: bool = False,
+    long_options: bool = False,
+    skip_errors: bool = False,
+) -> list[str] | list[str | None]:
+    """Render a batch of request objects as curl commands, in order.
+
+    Accepts what to_curl() accepts, with its options resolved once for the
+    whole batch. Raises ValueError for an invalid combination of options, and
+    RenderError — a ValueError carrying the index and the request — for the
+    first request that cannot be rendered; skip_errors=True leaves None in the
+    place of each such request instead.
+    """
+    return get_renderer(shell, pretty, long_options).render_many(requests, skip_errors=skip_errors)
+
+
+@overload
+async def to_curl_many_async(
+    requests: Iterable[object],
+    shell: str = ...,
+    pretty: bool = ...,
+    long_options: bool = ...,
+    concurrency: int = ...,
+    skip_errors: Literal[False] = False,
+) -> list[str]: ...
+
+
+@overload
+async def to_curl_many_async(
+    requests: Iterable[object],
+    shell: str = ...,
+    pretty: bool = ...,
+    long_options: bool = ...,
+    concurrency: int = ...,
+    *,
+    skip_errors: bool,
+) -> list[str | None]: ...
+
+
+async def to_curl_many_async(
+    requests: Iterable[object],
+    shell: str = SH,
+    pretty: bool = False,
+    long_options: bool = False,
+    concurrency: int = 16,
+    skip_errors: bool = False,
+) -> list[str] | list[str | None]:
+    """Render a batch of request objects as curl commands, awaiting the bodies.
+
+    Accepts what to_curl_async() accepts. Up to concurrency bodies are awaited
+    at a time, and the commands come back in the order of the requests. The
+    errors are those of to_curl_many(): the first failure cancels the rest of
+    the batch and raises RenderError, unless skip_errors=True.
+    """
+    return await get_renderer(shell, pretty, long_options).arender_many(requests, concurrency, skip_errors=skip_errors)
+
+
+def to_curl_into(
+    request: object,
+    stream: Stream,
+    shell: str = SH,
+    pretty: bool = False,
+    long_options: bool = False,
+) -> None:
+    """Render a request object as a curl command straight into a stream.
+
+    Writes what to_curl() returns, in blocks: text into an io.TextIOBase (a
+    file opened in text mode, sys.stdout, gzip.open(..., "wt")), utf-8 encoded
+    bytes into anything else with a write() method (a binary file, a socket's
+    makefile("wb"), gzip.open(..., "wb")). An sh body is quoted a chunk at a
+    time as it is written, so the command never exists in memory as a whole;
+    nothing is written when the command cannot be rendered.
+
+    Accepts the request types, options and ValueError contract of to_curl().
+    """
+    get_renderer(shell, pretty, long_options).render_into(request, stream)
+
+
+async def to_curl_into_async(
+    request: object,
+    stream: Stream,
+    shell: str = SH,
+    pretty: bool = False,
+    long_options: bool = False,
+) -> None:
+    """Render a request object as a curl command into a stream, awaiting the body.
+
+    Writes what to_curl_async() returns, the way to_curl_into() does. A stream
+    with a drain() coroutine, such as an asyncio.StreamWriter, is drained after
+    every block.
+    """
+    await get_renderer(shell, pretty, long_options).arender_into(request, stream)
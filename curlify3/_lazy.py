@@ -0,0 +1,75 @@
+from curlify3._curl import SH, Renderer, get_renderer, snapshot, snapshot_async
+from curlify3._types import RequestSnapshot
+
+
+class LazyCurl:
+    """A curl command that is rendered the first time it is formatted.
+
+    Holds a RequestSnapshot and the Renderer to render it with; str(), format()
+    and an f-string render it once and then return the cached command. Hand one
+    to a logger in place of the string and a record that is never emitted costs
+    the capture alone: logging formats its arguments only when a handler takes
+    the record. A command that cannot be rendered raises its ValueError when it
+    is formatted, not when it is created.
+    """
+
+    __slots__ = ("_command", "renderer", "snapshot")
+
+    def __init__(
+        self,
+        snapshot: RequestSnapshot,
+        renderer: Renderer | None = None,
+    ) -> None:
+        self.snapshot = snapshot
+        self.renderer = get_renderer() if renderer is None else renderer
+        self._command: str | None = None
+
+    def __str__(
+        self,
+    ) -> str:
+        # two threads formatting the same record at once both render it, to the same string;
+        # cheaper than a lock every other format would pay for
+        if self._command is None:
+            self._command = self.renderer.render_snapshot(self.snapshot)
+        return self._command
+
+    def __format__(
+        self,
+        format_spec: str,
+    ) -> str:
+        return format(str(self), format_spec)
+
+    def __repr__(
+        self,
+    ) -> str:
+        state = "rendered" if self._command is not None else "pending"
+        return f"<LazyCurl {self.snapshot.method} {self.snapshot.url} ({state})>"
+
+
+def lazy(
+    request: object,
+    shell: str = SH,
+    pretty: bool = False,
+    long_options: bool = False,
+) -> LazyCurl:
+    """Capture a request now and render it as a curl command when first formatted.
+
+    Accepts the request types of to_curl(). The options are validated here, and
+    raise ValueError right away, as does an unknown request type; a body that
+    cannot be rendered raises when the command is formatted.
+    """
+    return LazyCurl(snapshot(request), get_renderer(shell, pretty, long_options))
+
+
+async def lazy_async(
+    request: object,
+    shell: str = SH,
+    pretty: bool = False,
+    long_options: bool = False,
+) -> LazyCurl:
+    """Capture a request now, awaiting the body, and render it when first formatted.
+
+    Accepts the request types of to_curl_async(); otherwise the same as lazy().
+    """
+    renderer = get_renderer(shell, pretty, long_options)
+    return LazyCurl(await snapshot_async(request), renderer)
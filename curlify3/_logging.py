@@ -0,0 +1,106 @@
+import logging
+import queue
+
+from logging.handlers import QueueHandler, QueueListener
+from typing import Final, Literal
+
+DROP_NEWEST: Final = "drop-newest"
+DROP_OLDEST: Final = "drop-oldest"
+
+
+class _Listener(QueueListener):
+    def __init__(
+        self,
+        records: queue.Queue[logging.LogRecord | None],
+        *handlers: logging.Handler,
+    ) -> None:
+        super().__init__(records, *handlers, respect_handler_level=True)
+        self._records = records
+
+    def enqueue_sentinel(
+        self,
+    ) -> None:
+        # stop() must not lose to a full queue, which put_nowait would: waiting for the room
+        # is waiting for the listener to get through what is queued, which stop() does anyway.
+        # None is QueueListener's sentinel
+        self._records.put(None)
+
+
+class CurlQueueHandler(QueueHandler):
+    """A logging handler that formats and emits records on a background thread.
+
+    Records are put on a bounded queue as they are, and a listener thread hands
+    them to the given handlers, which format them there. Log a LazyCurl (see
+    lazy() / lazy_async()) through it and the request is captured on the calling
+    thread while the command is rendered on the listener's:
+
+        handler = CurlQueueHandler(logging.FileHandler("requests.log"))
+        logger.addHandler(handler)
+        logger.info("request: %s", await lazy_async(request))
+
+    Logging never waits for the listener: once maxsize records are queued, each
+    new record either is dropped (overflow="drop-newest") or pushes the oldest
+    queued one out (overflow="drop-oldest"), and dropped counts them. close()
+    stops the listener after the queued records are emitted.
+    """
+
+    def __init__(
+        self,
+        *handlers: logging.Handler,
+        maxsize: int = 10_000,
+        overflow: Literal["drop-newest", "drop-oldest"] = DROP_NEWEST,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be a positive number of records, got {maxsize!r}")
+        if overflow not in (DROP_NEWEST, DROP_OLDEST):
+            raise ValueError(f"unknown overflow policy: {overflow!r}, expected one of {[DROP_NEWEST, DROP_OLDEST]}")
+        self._records: queue.Queue[logging.LogRecord | None] = queue.Queue(maxsize)
+        super().__init__(self._records)
+        self.overflow = overflow
+        self.dropped = 0
+        self.listener: QueueListener | None = _Listener(self._records, *handlers)
+        self.listener.start()
+
+    def prepare(
+        self,
+        record: logging.LogRecord,
+    ) -> logging.LogRecord:
+        # QueueHandler formats the message here, on the thread that logs, so that the record
+        # survives pickling to another process — the very rendering this handler moves off
+        # that thread. The queue stays in the process, and the record crosses it as it is
+        return record
+
+    def enqueue(
+        self,
+        record: logging.LogRecord,
+    ) -> None:
+        # runs under the handler's lock, which serialises the producers and so the counter
+        try:
+            self._records.put_nowait(record)
+            return
+        except queue.Full:
+            if self.overflow == DROP_NEWEST:
+                self.dropped += 1
+                return
+        while True:
+            # the listener may empty the queue in between: then there is nothing to push out,
+            # and room for the record on the next try
+            try:
+                self._records.get_nowait()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+            try:
+                self._records.put_nowait(record)
+                return
+            except queue.Full:
+                continue
+
+    def close(
+        self,
+    ) -> None:
+        # logging.shutdown() closes every handler once more at exit
+        listener, self.listener = self.listener, None
+        if listener is not None:
+            listener.stop()
+        super().close()
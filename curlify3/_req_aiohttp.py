@@ -26,10 +26,11 @@ streaming bodies render without -d):
         await session.post("https://httpbin.org/post", json={"hello": "world"})
 """
 
-from aiohttp import ClientRequest, Payload, web
+from aiohttp import ClientRequest, MultipartWriter, Payload, web
 
 from curlify3._base import AsyncBaseRequestData
-from curlify3._types import Body
+from curlify3._curl import make_form_part
+from curlify3._types import Body, Form, FormPart
 
 
 class AiohttpServerRequest(AsyncBaseRequestData[web.Request]):
@@ -70,6 +71,32 @@ async def _payload_bytes(
     return raw if isinstance(raw, bytes) else bytes(raw)
 
 
+async def _multipart_form(
+    writer: MultipartWriter,
+) -> Form | None:
+    # a FormData with files, or a MultipartWriter built by hand, keeps its parts as
+    # payloads with headers of their own. They are handed over as they are, rather than
+    # encoded into a body for the curl builder to take apart again: a file payload is
+    # never read, and a plain field is rendered from the value it holds
+    parts: list[FormPart] = []
+    for payload, encoding, te_encoding in writer._parts:
+        head = getattr(payload, "_binary_headers", None)
+        # a compressed or transfer-encoded part, or a nested writer, is left to the
+        # encoded body: the former would render the value the request does not send
+        if encoding or te_encoding or isinstance(payload, MultipartWriter) or not isinstance(head, bytes):
+            return None
+        part = make_form_part(head, None)
+        if part is None:
+            continue
+        if not part.is_file:
+            value = await _payload_bytes(payload)
+            if value is None:
+                return None
+            part = part._replace(value=value)
+        parts.append(part)
+    return tuple(parts)
+
+
 class AiohttpClientRequest(AsyncBaseRequestData[ClientRequest]):
     _instance_of = ClientRequest
 
@@ -77,6 +104,10 @@ class AiohttpClientRequest(AsyncBaseRequestData[ClientRequest]):
         self,
     ) -> Body:
         body = self._request.body
+        if isinstance(body, MultipartWriter):
+            form = await _multipart_form(body)
+            if form is not None:
+                return form
         # an absent body is spelled b"", anything else is a Payload. A payload
         # built with compress= comes back uncompressed here while the rendered
         # content-encoding header claims otherwise — rare enough to leave be
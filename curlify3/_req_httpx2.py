@@ -13,7 +13,35 @@ The generated command includes --http2:
 import httpx2
 
 from curlify3._base import AsyncBaseRequestData, BaseRequestData
-from curlify3._types import Body
+from curlify3._curl import make_form_part
+from curlify3._types import Body, Form, FormPart
+
+
+def _multipart_form(
+    stream: object,
+) -> Form | None:
+    # a request built with files= keeps its fields on the multipart stream, and so do the
+    # values of data= next to them. They are handed over as they are, rather than encoded
+    # into a body for the curl builder to take apart again: a file is never read, and a
+    # plain field is rendered from the value it was given. The stream class is private,
+    # so it is recognised by its fields
+    fields = getattr(stream, "fields", None)
+    if not isinstance(fields, list):
+        return None
+    parts: list[FormPart] = []
+    for field in fields:
+        if getattr(field, "file", None) is None:
+            value = field.render_data()
+        elif field.filename:
+            value = None
+        else:
+            # a file field without a filename is encoded as a plain field, so it renders
+            # as one and its contents are the value — the tuple form (None, value) of files=
+            value = b"".join(field.render_data())
+        part = make_form_part(field.render_headers(), value)
+        if part is not None:
+            parts.append(part)
+    return tuple(parts)
 
 
 class Httpx2Request(BaseRequestData[httpx2.Request]):
@@ -24,6 +52,9 @@ class Httpx2Request(BaseRequestData[httpx2.Request]):
     def body(
         self,
     ) -> Body:
+        form = _multipart_form(self._request.stream)
+        if form is not None:
+            return form
         data = self._request.read()
         try:
             return data.decode()
@@ -39,6 +70,9 @@ class AsyncHttpx2Request(AsyncBaseRequestData[httpx2.Request]):
     async def body(
         self,
     ) -> Body:
+        form = _multipart_form(self._request.stream)
+        if form is not None:
+            return form
         data = await self._request.aread()
         try:
             return data.decode()
@@ -15,6 +15,9 @@ are negotiated on the transport, so the command carries no --http2.
     print(to_curl(req))
 """
 
+from collections.abc import Iterable
+from typing import Any
+
 import niquests
 
 from curlify3._base import BaseRequestData
@@ -27,6 +30,15 @@ from curlify3._types import Body
 class NiquestsRequest(BaseRequestData[niquests.PreparedRequest]):
     _instance_of = niquests.PreparedRequest
 
+    def _header_items(
+        self,
+    ) -> Iterable[tuple[Any, Any]]:
+        # the case-insensitive dict keeps every name lowercased next to its value: one pass
+        # over that store instead of a case-insensitive lookup per name. niquests declares
+        # the headers optional, for a request that was never prepared
+        headers = self._request.headers
+        return () if headers is None else headers.lower_items()
+
     def body(
         self,
     ) -> Body:
@@ -1,10 +1,51 @@
-from typing import Any, Protocol, TypeAlias
+from typing import Any, NamedTuple, Protocol, TypeAlias
 
-# a body reaches the curl builder as text when it decodes, and raw otherwise
-Body: TypeAlias = str | bytes | None
+
+class FormPart(NamedTuple):
+    # one part of a multipart body, as the curl builder renders it. An adapter whose
+    # library keeps the form as fields hands them over as these, and a body that arrives
+    # encoded is taken apart into the same
+    name: bytes
+    # the literal value of a plain field; for a file part, the contents when they are at
+    # hand and None when the adapter left the file unread
+    value: bytes | memoryview | None
+    filename: bytes | None = None
+
+    @property
+    def is_file(
+        self,
+    ) -> bool:
+        return self.filename is not None
+
+
+Form: TypeAlias = tuple[FormPart, ...]
+# a body reaches the curl builder as text when it decodes, and raw otherwise — or as the
+# parts of a multipart form, when the adapter has them without encoding the body
+Body: TypeAlias = str | bytes | Form | None
 Headers: TypeAlias = dict[str, str]
 
 
+class RequestSnapshot(NamedTuple):
+    """Everything a curl command is rendered from, captured off a request in one pass.
+
+    Take one with snapshot() / snapshot_async() and render it with render(), as
+    many times and in as many dialects as needed, on any thread, long after the
+    request is gone: a snapshot is immutable and holds no reference to it.
+
+    headers are (name, value) pairs with lowercased names, the cookie header
+    lifted out into cookies. body is text when it decoded as UTF-8, bytes when
+    it did not, a tuple of FormPart for a multipart form the client library held
+    as fields, and None when there is none.
+    """
+
+    method: str
+    url: str
+    headers: tuple[tuple[str, str], ...]
+    cookies: str | None
+    body: Body
+    http2: bool = False
+
+
 class _CommonRequestData(Protocol):
     # everything the curl builder needs from an adapter except the body
     @property
@@ -38,12 +79,20 @@ class RequestData(_CommonRequestData, Protocol):
         self,
     ) -> Body: ...
 
+    def snapshot(
+        self,
+    ) -> RequestSnapshot: ...
+
 
 class AsyncRequestData(_CommonRequestData, Protocol):
     async def body(
         self,
     ) -> Body: ...
 
+    async def snapshot(
+        self,
+    ) -> RequestSnapshot: ...
+
 
 class RawRequest(Protocol):
     # the shape shared by the request objects the adapters wrap; the libraries
@@ -1,125 +1,130 @@
-from collections.abc import Callable, Sequence
-from contextlib import suppress
-from typing import Any, TypeVar
-
-from curlify3._types import AsyncRequestData, RequestData
-
-# the first adapter that accepts the request wins, so the more specific one
-# comes first: httpx2 before httpx, in case a future httpx2 derives its Request
-# from httpx's and an httpx2 request starts matching both — the http2 adapter
-# has to keep winning, otherwise the command silently loses --http2
-_REQUEST_DATA_CLASSES: list[Callable[[Any], RequestData]] = []
-_REQUEST_DATA_CLASSES_ASYNC: list[Callable[[Any], AsyncRequestData]] = []
-
-
-with suppress(ImportError):
-    from curlify3._req_requests import RequestsRequest
-
-    _REQUEST_DATA_CLASSES.append(RequestsRequest)
-
-
-with suppress(ImportError):
-    from curlify3._req_niquests import NiquestsRequest
-
-    _REQUEST_DATA_CLASSES.append(NiquestsRequest)
-
-
-with suppress(ImportError):
-    from curlify3._req_httpx2 import Httpx2Request
-
-    _REQUEST_DATA_CLASSES.append(Httpx2Request)
-
-
-with suppress(ImportError):
-    from curlify3._req_httpx2 import AsyncHttpx2Request
-
-    _REQUEST_DATA_CLASSES_ASYNC.append(AsyncHttpx2Request)
-
-
-with suppress(ImportError):
-    from curlify3._req_httpx import HttpxRequest
-
-    _REQUEST_DATA_CLASSES.append(HttpxRequest)
-
-
-with suppress(ImportError):
-    from curlify3._req_httpx import AsyncHttpxRequest
-
-    _REQUEST_DATA_CLASSES_ASYNC.append(AsyncHttpxRequest)
-
-
-with suppress(ImportError):
-    from curlify3._req_aiohttp import AiohttpServerRequest
-
-    _REQUEST_DATA_CLASSES_ASYNC.append(AiohttpServerRequest)
+import sys
 
+from importlib import import_module
+from typing import Any, NamedTuple, cast
 
-with suppress(ImportError):
-    from curlify3._req_aiohttp import AiohttpClientRequest
-
-    _REQUEST_DATA_CLASSES_ASYNC.append(AiohttpClientRequest)
-
-
-with suppress(ImportError):
-    from curlify3._req_starlette import StarletteRequest
-
-    _REQUEST_DATA_CLASSES_ASYNC.append(StarletteRequest)
-
-
-with suppress(ImportError):
-    from curlify3._req_django import DjangoRequest
-
-    _REQUEST_DATA_CLASSES.append(DjangoRequest)
-
-
-with suppress(ImportError):
-    from curlify3._req_werkzeug import WerkzeugRequest
-
-    _REQUEST_DATA_CLASSES.append(WerkzeugRequest)
-
-
-with suppress(ImportError):
-    from curlify3._req_tornado import TornadoRequest
-
-    _REQUEST_DATA_CLASSES.append(TornadoRequest)
-
-
-with suppress(ImportError):
-    from curlify3._req_tornado import TornadoServerRequest
-
-    _REQUEST_DATA_CLASSES.append(TornadoServerRequest)
-
-
-# stdlib, so the import cannot fail and the adapter is always registered; it
-# stays last so the third-party adapters are tried first
-with suppress(ImportError):
-    from curlify3._req_urllib import UrllibRequest
-
-    _REQUEST_DATA_CLASSES.append(UrllibRequest)
+from curlify3._types import AsyncRequestData, RequestData
 
 
-_DataT = TypeVar("_DataT")
+class _Registration(NamedTuple):
+    # the dotted path the library documents its request class under
+    request_class: str
+    # the dotted path of the adapter that accepts it, imported the first time a
+    # request of that class arrives
+    adapter: str
+
+    @property
+    def package(
+        self,
+    ) -> str:
+        return self.request_class.partition(".")[0]
+
+
+# an adapter is registered by name alone, so importing curlify3 imports none of
+# the libraries: by the time a request object exists its library is loaded, and
+# only then is the adapter for it. Nothing is lost when a library is missing —
+# no request of it can ever arrive
+#
+# the most specific adapter wins, so the more specific one comes first as well:
+# httpx2 before httpx, in case a future httpx2 derives its Request from httpx's
+# and an httpx2 request starts matching both — the http2 adapter has to keep
+# winning, otherwise the command silently loses --http2
+_REQUEST_DATA_CLASSES: list[_Registration] = [
+    _Registration("requests.PreparedRequest", "curlify3._req_requests.RequestsRequest"),
+    _Registration("niquests.PreparedRequest", "curlify3._req_niquests.NiquestsRequest"),
+    _Registration("httpx2.Request", "curlify3._req_httpx2.Httpx2Request"),
+    _Registration("httpx.Request", "curlify3._req_httpx.HttpxRequest"),
+    _Registration("django.http.HttpRequest", "curlify3._req_django.DjangoRequest"),
+    _Registration("werkzeug.wrappers.Request", "curlify3._req_werkzeug.WerkzeugRequest"),
+    _Registration("tornado.httpclient.HTTPRequest", "curlify3._req_tornado.TornadoRequest"),
+    _Registration("tornado.httputil.HTTPServerRequest", "curlify3._req_tornado.TornadoServerRequest"),
+    _Registration("urllib.request.Request", "curlify3._req_urllib.UrllibRequest"),
+]
+_REQUEST_DATA_CLASSES_ASYNC: list[_Registration] = [
+    _Registration("httpx2.Request", "curlify3._req_httpx2.AsyncHttpx2Request"),
+    _Registration("httpx.Request", "curlify3._req_httpx.AsyncHttpxRequest"),
+    _Registration("aiohttp.web.Request", "curlify3._req_aiohttp.AiohttpServerRequest"),
+    _Registration("aiohttp.ClientRequest", "curlify3._req_aiohttp.AiohttpClientRequest"),
+    _Registration("starlette.requests.Request", "curlify3._req_starlette.StarletteRequest"),
+]
+
+# the adapter each concrete request type resolved to, so that only the first
+# request of a type pays for the lookup; cleared whenever an adapter is added
+_REQUEST_DATA_CACHE: dict[type[Any], Any] = {}
+_REQUEST_DATA_CACHE_ASYNC: dict[type[Any], Any] = {}
+
+
+def _register(
+    registration: _Registration,
+    request_data_classes: list[_Registration],
+    cache: dict[type[Any], Any],
+) -> None:
+    request_data_classes.append(registration)
+    cache.clear()
+
+
+def _import_name(
+    dotted: str,
+) -> Any:  # noqa: ANN401
+    module_name, _, name = dotted.rpartition(".")
+    # sys.modules first: the module of a request class is normally loaded by the
+    # time one of its requests arrives, and then this is a dict lookup
+    module = sys.modules.get(module_name)
+    if module is None:
+        try:
+            module = import_module(module_name)
+        except ImportError:
+            # an adapter whose module fails to import is left unregistered, the
+            # way a missing library leaves it
+            return None
+    return getattr(module, name, None)
+
+
+def _resolve_request_data_class(
+    request_type: type[Any],
+    request_data_classes: list[_Registration],
+) -> Any:  # noqa: ANN401
+    # the mro runs from the most specific class to the least, so a subclass with
+    # an adapter of its own is never claimed by the adapter of its base; among
+    # adapters of the same class the registration order decides
+    for klass in request_type.__mro__:
+        # a class is only ever compared with the registrations of its own
+        # package, so no other library is imported to find out it does not match
+        package = klass.__module__.partition(".")[0]
+        for registration in request_data_classes:
+            if registration.package != package or _import_name(registration.request_class) is not klass:
+                continue
+            adapter = _import_name(registration.adapter)
+            if adapter is not None:
+                return adapter
+    raise ValueError('unknown request object')
 
 
 def _find_request_data_obj(
     request: object,
-    request_data_classes: Sequence[Callable[[Any], _DataT]],
-) -> _DataT:
-    for _cls in request_data_classes:
-        try:
-            return _cls(request)
-        except ValueError:
-            continue
-    raise ValueError('unknown request object')
+    request_data_classes: list[_Registration],
+    cache: dict[type[Any], Any],
+) -> Any:  # noqa: ANN401
+    # __class__ rather than type(): a proxy such as flask.request reports the
+    # class of the object behind it there, the same way isinstance() sees it
+    request_type = request.__class__
+    try:
+        adapter = cache[request_type]
+    except KeyError:
+        adapter = cache[request_type] = _resolve_request_data_class(request_type, request_data_classes)
+    return adapter(request)
 
 
 def make_request_obj(
     request: object,
 ) -> RequestData:
-    return _find_request_data_obj(request, _REQUEST_DATA_CLASSES)
+    return cast(RequestData, _find_request_data_obj(request, _REQUEST_DATA_CLASSES, _REQUEST_DATA_CACHE))
 
 
 def make_request_obj_async(
     request: object,
 ) -> AsyncRequestData:
-    return _find_request_data_obj(request, _REQUEST_DATA_CLASSES_ASYNC)
+    return cast(
+        AsyncRequestData,
+        _find_request_data_obj(request, _REQUEST_DATA_CLASSES_ASYNC, _REQUEST_DATA_CACHE_ASYNC),
+    )
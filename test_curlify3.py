@@ -1,10 +1,15 @@
 import asyncio
+import gzip
+import io
+import logging
 import pathlib
+import subprocess
 import sys
+import threading
 import urllib.request
 
 from collections.abc import AsyncIterator
-from typing import Any
+from typing import Any, Literal
 
 import aiohttp
 import fastapi
@@ -26,11 +31,31 @@ from django.http import HttpRequest as DjangoHttpRequest
 from django.test import RequestFactory
 from pytest_aiohttp.plugin import AiohttpClient
 
-from curlify3 import POWERSHELL, to_curl, to_curl_async
-from curlify3._curl import quote_powershell, quote_sh, quote_sh_bytes, quote_sh_word
+from curlify3 import (
+    POWERSHELL,
+    CurlQueueHandler,
+    FragmentCache,
+    FragmentCacheInfo,
+    LazyCurl,
+    Renderer,
+    RenderError,
+    RequestSnapshot,
+    lazy,
+    lazy_async,
+    render,
+    snapshot,
+    snapshot_async,
+    to_curl,
+    to_curl_async,
+    to_curl_into,
+    to_curl_into_async,
+    to_curl_many,
+    to_curl_many_async,
+)
+from curlify3._curl import quote_powershell, quote_sh, quote_sh_bytes, quote_sh_word, split_multipart_body
 
 # imported directly so a broken adapter module fails collection loudly instead
-# of quietly disappearing from the registries under suppress(ImportError)
+# of quietly disappearing from the registries, which only name it
 from curlify3._req_aiohttp import AiohttpClientRequest, AiohttpServerRequest
 from curlify3._req_django import DjangoRequest
 from curlify3._req_httpx import AsyncHttpxRequest, HttpxRequest
@@ -41,7 +66,15 @@ from curlify3._req_starlette import StarletteRequest
 from curlify3._req_tornado import TornadoRequest, TornadoServerRequest
 from curlify3._req_urllib import UrllibRequest
 from curlify3._req_werkzeug import WerkzeugRequest
-from curlify3._utils import _REQUEST_DATA_CLASSES, _REQUEST_DATA_CLASSES_ASYNC
+from curlify3._utils import (
+    _REQUEST_DATA_CACHE,
+    _REQUEST_DATA_CLASSES,
+    _REQUEST_DATA_CLASSES_ASYNC,
+    _import_name,
+    _register,
+    _Registration,
+    make_request_obj,
+)
 
 # RequestFactory-built requests need configured settings by the time
 # build_absolute_uri() validates the host inside to_curl
@@ -674,6 +707,36 @@ async def test_aiohttp_client_middleware_to_curl(
     ], captured
 
 
+class _UnreadableFile(io.BytesIO):
+    # a file part that has to render without being read: the multipart fast path hands
+    # the fields over as they are, so reading the file would be a regression
+    def read(
+        self,
+        size: int | None = -1,
+    ) -> bytes:
+        raise AssertionError("the file part was read")
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_client_multipart_form_fields() -> None:
+    form = aiohttp.FormData()
+    form.add_field("foo", "bar")
+    form.add_field("image", _UnreadableFile(), filename="image.png", content_type="image/png")
+    form.add_field("ref", "@x")
+    req = aiohttp.ClientRequest(
+        "POST",
+        yarl.URL("https://httpbin.org/post"),
+        data=form,
+        skip_auto_headers=("Accept", "Accept-Encoding", "User-Agent"),
+        loop=asyncio.get_running_loop(),
+    )
+    boundary = req.headers["content-type"].rsplit("boundary=")[1]
+    assert await to_curl_async(req) == (
+        f"curl -X POST -H 'host: httpbin.org' -H 'content-type: multipart/form-data; boundary={boundary}' "
+        "-F 'foo=bar' -F 'image=@image.png' --form-string 'ref=@x' https://httpbin.org/post"
+    )
+
+
 _HTTPX2_PARAMS = [
     pytest.param(
         httpx2.Request(
@@ -933,6 +996,20 @@ def test_quote_sh_bytes_invariants() -> None:
     assert "\n" not in quoted, quoted
 
 
+def test_quote_sh_bytes_table() -> None:
+    # the translation table has to spell every byte the way the escaping rule reads: the
+    # two characters that carry meaning inside $'...' escaped, the rest of printable
+    # ascii as itself, and everything else as \xNN
+    for byte in range(256):
+        if byte in (0x27, 0x5C):
+            expected = "\\" + chr(byte)
+        elif 0x20 <= byte <= 0x7E:
+            expected = chr(byte)
+        else:
+            expected = f"\\x{byte:02x}"
+        assert quote_sh_bytes(bytes([byte])) == f"$'{expected}'", byte
+
+
 @pytest.mark.parametrize(
     "content",
     [
@@ -984,6 +1061,9 @@ def test_to_curl_bytes_body_pretty() -> None:
         pytest.param(r'x\"y', r'"x\\\"y"', id="BACKSLASH BEFORE QUOTE"),
         pytest.param("ab\\", r'"ab\\"', id="TRAILING BACKSLASH"),
         pytest.param("a b\\", r'"a b\\"', id="TRAILING BACKSLASH WITH SPACE"),
+        pytest.param("\\\\", r'"\\\\"', id="ONLY BACKSLASHES"),
+        pytest.param('a\\"b\\', r'"a\\\"b\\"', id="QUOTE AND TRAILING BACKSLASH"),
+        pytest.param('""', r'"\"\""', id="ONLY QUOTES"),
     ],
 )
 def test_quote_powershell(
@@ -1417,28 +1497,388 @@ def test_urllib_unredirected_headers_are_rendered() -> None:
 
 
 def test_request_data_registries() -> None:
-    # _utils registers every adapter under suppress(ImportError), so a broken
+    # _utils registers every adapter by name, so a misspelled path or a broken
     # adapter module drops out of the registry silently and only shows up as an
     # unrelated "unknown request object" later. The order is part of the
-    # contract too: the first adapter that accepts the request wins.
-    assert list(_REQUEST_DATA_CLASSES) == [
-        RequestsRequest,
-        NiquestsRequest,
-        Httpx2Request,
-        HttpxRequest,
-        DjangoRequest,
-        WerkzeugRequest,
-        TornadoRequest,
-        TornadoServerRequest,
-        UrllibRequest,
+    # contract too: among adapters of the same class the first one wins.
+    assert [(_import_name(entry.request_class), _import_name(entry.adapter)) for entry in _REQUEST_DATA_CLASSES] == [
+        (requests.PreparedRequest, RequestsRequest),
+        (niquests.PreparedRequest, NiquestsRequest),
+        (httpx2.Request, Httpx2Request),
+        (httpx.Request, HttpxRequest),
+        (DjangoHttpRequest, DjangoRequest),
+        (werkzeug.Request, WerkzeugRequest),
+        (tornado.httpclient.HTTPRequest, TornadoRequest),
+        (tornado.httputil.HTTPServerRequest, TornadoServerRequest),
+        (urllib.request.Request, UrllibRequest),
+    ]
+    assert [
+        (_import_name(entry.request_class), _import_name(entry.adapter)) for entry in _REQUEST_DATA_CLASSES_ASYNC
+    ] == [
+        (httpx2.Request, AsyncHttpx2Request),
+        (httpx.Request, AsyncHttpxRequest),
+        (aiohttp_web.Request, AiohttpServerRequest),
+        (aiohttp.ClientRequest, AiohttpClientRequest),
+        (fastapi.Request, StarletteRequest),
     ]
-    assert list(_REQUEST_DATA_CLASSES_ASYNC) == [
-        AsyncHttpx2Request,
-        AsyncHttpxRequest,
-        AiohttpServerRequest,
-        AiohttpClientRequest,
-        StarletteRequest,
+    # every adapter accepts exactly the class it is registered under
+    for entry in _REQUEST_DATA_CLASSES + _REQUEST_DATA_CLASSES_ASYNC:
+        assert _import_name(entry.adapter)._instance_of is _import_name(entry.request_class), entry
+
+
+def test_import_loads_no_library() -> None:
+    # the adapters are registered by name, so importing curlify3 — and rendering a
+    # request of one library — imports no other library
+    libraries = ["requests", "niquests", "httpx", "httpx2", "aiohttp", "starlette", "django", "werkzeug", "tornado"]
+    script = (
+        "import sys, urllib.request, curlify3\n"
+        "curlify3.to_curl(urllib.request.Request('https://httpbin.org/get'))\n"
+        f"print([name for name in {libraries!r} if name in sys.modules])\n"
+    )
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert completed.stdout.strip() == "[]", completed
+
+
+def test_request_data_dispatch_is_cached() -> None:
+    req = urllib.request.Request("https://httpbin.org/get")
+    assert isinstance(make_request_obj(req), UrllibRequest)
+    assert _REQUEST_DATA_CACHE[urllib.request.Request] is UrllibRequest
+
+
+def test_request_data_dispatch_prefers_the_most_specific_adapter(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # the precedence the registry order stands for: a request type derived from one
+    # that has an adapter of its own is claimed by the derived type's adapter, even
+    # when the base adapter was registered first
+    class DerivedRequest(httpx.Request):
+        pass
+
+    class DerivedAdapter(HttpxRequest):
+        _instance_of = DerivedRequest
+
+    # registered by name like every other adapter, so both have to be importable
+    module = sys.modules[__name__]
+    monkeypatch.setattr(module, "DerivedRequest", DerivedRequest, raising=False)
+    monkeypatch.setattr(module, "DerivedAdapter", DerivedAdapter, raising=False)
+    registration = _Registration(f"{__name__}.DerivedRequest", f"{__name__}.DerivedAdapter")
+
+    req = DerivedRequest(method="GET", url="https://httpbin.org/get")
+    assert type(make_request_obj(req)) is HttpxRequest
+    try:
+        _register(registration, _REQUEST_DATA_CLASSES, _REQUEST_DATA_CACHE)
+        # the cached resolution would still name HttpxRequest: registering has to drop it
+        assert type(make_request_obj(req)) is DerivedAdapter
+    finally:
+        _REQUEST_DATA_CLASSES.remove(registration)
+        _REQUEST_DATA_CACHE.clear()
+
+
+def test_request_data_dispatch_unknown_request() -> None:
+    with pytest.raises(ValueError, match="unknown request object"):
+        to_curl(object())
+
+
+def test_snapshot_render() -> None:
+    req = requests.Request(
+        method="POST",
+        url="https://httpbin.org/post",
+        headers={"Cookie": "bar=baz", "X-Foo": "bar"},
+        data=b"foo",
+    ).prepare()
+    captured = snapshot(req)
+    assert captured == RequestSnapshot(
+        method="POST",
+        url="https://httpbin.org/post",
+        headers=(("x-foo", "bar"), ("content-length", "3")),
+        cookies="bar=baz",
+        body="foo",
+    )
+    # the same snapshot renders in every dialect and layout, and to what to_curl renders
+    for shell, pretty, long_options in [("sh", False, False), (POWERSHELL, False, False), ("sh", True, True)]:
+        assert render(captured, shell, pretty, long_options) == to_curl(req, shell, pretty, long_options)
+    # rendering drops content-length and adds a content-type, on a copy of the headers
+    assert captured.headers == (("x-foo", "bar"), ("content-length", "3"))
+
+
+@pytest.mark.asyncio
+async def test_snapshot_async_render() -> None:
+    req = httpx.Request(method="POST", url="https://httpbin.org/post", content=b"\xff")
+    captured = await snapshot_async(req)
+    assert captured.body == b"\xff"
+    assert render(captured) == await to_curl_async(req)
+
+
+def test_renderer() -> None:
+    req = requests.Request(
+        method="POST", url="https://httpbin.org/post", headers={"X-Foo": "bar"}, data=b"foo"
+    ).prepare()
+    for shell, pretty, long_options in [("sh", False, False), (POWERSHELL, False, True), ("sh", True, False)]:
+        renderer = Renderer(shell=shell, pretty=pretty, long_options=long_options)
+        assert renderer.render(req) == to_curl(req, shell, pretty, long_options)
+        # the renderer keeps no state between commands
+        assert renderer.render(req) == renderer.render_snapshot(snapshot(req))
+    assert repr(Renderer()) == "Renderer(shell='sh', pretty=False, long_options=False, fragment_cache=None)"
+
+
+def test_renderer_validates_once() -> None:
+    with pytest.raises(ValueError, match="unknown shell"):
+        Renderer(shell="cmd")
+    with pytest.raises(ValueError, match="pretty output is not supported"):
+        Renderer(shell=POWERSHELL, pretty=True)
+
+
+def test_renderer_fragment_cache() -> None:
+    cache = FragmentCache(maxsize=3)
+    # one cache serves renderers of different dialects and option styles without mixing them up
+    renderers = [Renderer(fragment_cache=cache), Renderer(shell=POWERSHELL, long_options=True, fragment_cache=cache)]
+    req = requests.Request(
+        method="POST",
+        url="https://httpbin.org/post",
+        headers={"Cookie": "bar=baz", "X-Foo": "it's"},
+        data=b"foo",
+    ).prepare()
+    for renderer in renderers:
+        expected = to_curl(req, renderer.shell, long_options=renderer.long_options)
+        assert renderer.render(req) == expected
+        assert renderer.render(req) == expected
+    # cookie, x-foo and content-type: missed on the first render of each renderer and hit on
+    # the second, and the second renderer's three evict the first's
+    assert cache.info() == FragmentCacheInfo(hits=6, misses=6, evictions=3, maxsize=3, size=3)
+    assert cache.info().hit_rate == 0.5
+    cache.clear()
+    assert cache.info() == FragmentCacheInfo(hits=0, misses=0, evictions=0, maxsize=3, size=0)
+    assert cache.info().hit_rate == 0.0
+    with pytest.raises(ValueError, match="maxsize"):
+        FragmentCache(maxsize=0)
+    # a skipped header is rendered all the same, but never looked up
+    cache = FragmentCache(skip_headers=["X-Foo"])
+    assert Renderer(fragment_cache=cache).render(req) == to_curl(req)
+    assert (cache.info().misses, cache.info().size) == (2, 2)
+    assert repr(cache) == "FragmentCache(maxsize=1024, skip_headers=['x-foo'])"
+
+
+@pytest.mark.asyncio
+async def test_renderer_arender() -> None:
+    req = httpx.Request(method="POST", url="https://httpbin.org/post", content=b"foo")
+    renderer = Renderer(long_options=True)
+    assert await renderer.arender(req) == await to_curl_async(req, long_options=True)
+
+
+def test_to_curl_many() -> None:
+    reqs = [
+        requests.Request(method="POST", url=f"https://httpbin.org/{index}", data=b"foo").prepare() for index in range(3)
     ]
+    assert to_curl_many(reqs, long_options=True) == [to_curl(req, long_options=True) for req in reqs]
+    unknown = object()
+    with pytest.raises(RenderError, match="request 1 of the batch cannot be rendered: unknown request object") as error:
+        to_curl_many([reqs[0], unknown, reqs[2]])
+    assert (error.value.index, error.value.request) == (1, unknown)
+    assert isinstance(error.value.__cause__, ValueError)
+    # the failure keeps its place, so the commands still line up with the requests
+    assert to_curl_many([reqs[0], unknown, reqs[2]], skip_errors=True) == [to_curl(reqs[0]), None, to_curl(reqs[2])]
+    assert to_curl_many([]) == []
+
+
+@pytest.mark.asyncio
+async def test_to_curl_many_async() -> None:
+    reqs = [httpx.Request(method="POST", url=f"https://httpbin.org/{index}", content=b"foo") for index in range(20)]
+    expected = [await to_curl_async(req) for req in reqs]
+    assert await to_curl_many_async(reqs, concurrency=3) == expected
+    failing = [*reqs[:5], object(), *reqs[5:]]
+    with pytest.raises(RenderError, match="request 5 of the batch"):
+        await to_curl_many_async(failing, concurrency=3)
+    assert await to_curl_many_async(failing, concurrency=3, skip_errors=True) == [*expected[:5], None, *expected[5:]]
+    with pytest.raises(ValueError, match="concurrency"):
+        await to_curl_many_async(reqs, concurrency=0)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        pytest.param("it's a body with a \\ and a ' or two '' " * 5, id="text"),
+        pytest.param(b"\xff\x00'\\" * 20, id="bytes"),
+        pytest.param("@/etc/passwd", id="file-reference"),
+    ],
+)
+@pytest.mark.parametrize(("shell", "pretty", "long_options"), [("sh", False, False), ("sh", True, True)])
+def test_to_curl_into(
+    monkeypatch: pytest.MonkeyPatch,
+    body: str | bytes,
+    shell: str,
+    pretty: bool,
+    long_options: bool,
+) -> None:
+    # a chunk size that splits every escape sequence somewhere
+    monkeypatch.setattr("curlify3._curl.WRITE_CHUNK", 7)
+    req = requests.Request(
+        method="POST", url="https://httpbin.org/post", headers={"Cookie": "a=b"}, data=body
+    ).prepare()
+    if isinstance(body, bytes) and 0 in body:
+        with pytest.raises(ValueError, match="NUL"):
+            to_curl_into(req, io.StringIO())
+        req.body = body.replace(b"\x00", b"")
+    expected = to_curl(req, shell, pretty, long_options)
+    text = io.StringIO()
+    to_curl_into(req, text, shell, pretty, long_options)
+    assert text.getvalue() == expected
+    binary = io.BytesIO()
+    with gzip.open(binary, "wb") as compressed:
+        to_curl_into(req, compressed, shell, pretty, long_options)
+    assert gzip.decompress(binary.getvalue()).decode() == expected
+
+
+def test_to_curl_into_writes_nothing_on_error() -> None:
+    req = requests.Request(method="POST", url="https://httpbin.org/post", data=b"\xff").prepare()
+    stream = io.StringIO()
+    with pytest.raises(ValueError, match="not valid utf-8"):
+        to_curl_into(req, stream, shell=POWERSHELL)
+    assert stream.getvalue() == ""
+
+
+@pytest.mark.asyncio
+async def test_to_curl_into_async() -> None:
+    class _DrainedStream(io.BytesIO):
+        drained = 0
+
+        async def drain(self) -> None:
+            self.drained += 1
+
+    req = httpx.Request(method="POST", url="https://httpbin.org/post", content=b"foo" * 100_000)
+    stream = _DrainedStream()
+    await to_curl_into_async(req, stream, long_options=True)
+    assert stream.getvalue().decode() == await to_curl_async(req, long_options=True)
+    # drained after every block, and a 300 KB body spans several
+    assert stream.drained > 1
+
+
+def test_lazy(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    req = requests.Request(method="POST", url="https://httpbin.org/post", data=b"foo").prepare()
+    expected = to_curl(req, long_options=True)
+    rendered = []
+    render_snapshot = Renderer.render_snapshot
+
+    def counting_render_snapshot(
+        self: Renderer,
+        captured: RequestSnapshot,
+    ) -> str:
+        rendered.append(captured)
+        return render_snapshot(self, captured)
+
+    monkeypatch.setattr(Renderer, "render_snapshot", counting_render_snapshot)
+    logger = logging.getLogger("test_curlify3.lazy")
+    command = lazy(req, long_options=True)
+    assert isinstance(command, LazyCurl)
+    assert repr(command) == "<LazyCurl POST https://httpbin.org/post (pending)>"
+    # a record below the level is dropped before its arguments are formatted
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        logger.debug("request: %s", command)
+    assert rendered == []
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        logger.debug("request: %s", command)
+        logger.debug("request again: %s", command)
+    assert [record.getMessage() for record in caplog.records] == [f"request: {expected}", f"request again: {expected}"]
+    assert f"{command:.4}" == expected[:4]
+    # rendered on the first format, served from the cache afterwards
+    assert len(rendered) == 1
+    assert repr(command) == "<LazyCurl POST https://httpbin.org/post (rendered)>"
+
+
+def test_lazy_errors() -> None:
+    # the options and the request type fail right away, the body when it is formatted
+    with pytest.raises(ValueError, match="unknown shell"):
+        lazy(requests.Request(method="GET", url="https://httpbin.org/get").prepare(), shell="cmd")
+    with pytest.raises(ValueError, match="unknown request object"):
+        lazy(object())
+    command = lazy(requests.Request(method="POST", url="https://httpbin.org/post", data=b"\xff").prepare(), POWERSHELL)
+    with pytest.raises(ValueError, match="not valid utf-8"):
+        str(command)
+
+
+@pytest.mark.asyncio
+async def test_lazy_async() -> None:
+    req = httpx.Request(method="POST", url="https://httpbin.org/post", content=b"foo")
+    command = await lazy_async(req, pretty=True)
+    assert str(command) == await to_curl_async(req, pretty=True)
+    assert command.snapshot == await snapshot_async(req)
+
+
+class _RecordingHandler(logging.Handler):
+    def __init__(
+        self,
+    ) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+        self.threads: set[int] = set()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def emit(
+        self,
+        record: logging.LogRecord,
+    ) -> None:
+        self.entered.set()
+        self.release.wait()
+        self.messages.append(self.format(record))
+        self.threads.add(threading.get_ident())
+
+
+def test_curl_queue_handler_renders_on_the_listener() -> None:
+    req = requests.Request(method="POST", url="https://httpbin.org/post", data=b"foo").prepare()
+    target = _RecordingHandler()
+    handler = CurlQueueHandler(target)
+    logger = logging.getLogger("test_curlify3.queue")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    try:
+        command = lazy(req)
+        logger.info("request: %s", command)
+    finally:
+        logger.removeHandler(handler)
+        # emits what is queued before the listener stops
+        handler.close()
+    assert target.messages == [f"request: {to_curl(req)}"]
+    assert target.threads and threading.get_ident() not in target.threads
+    handler.close()
+
+
+@pytest.mark.parametrize(
+    ("overflow", "emitted"),
+    [("drop-newest", ["0", "1", "2"]), ("drop-oldest", ["0", "3", "4"])],
+)
+def test_curl_queue_handler_overflow(
+    overflow: Literal["drop-newest", "drop-oldest"],
+    emitted: list[str],
+) -> None:
+    target = _RecordingHandler()
+    target.release.clear()
+    handler = CurlQueueHandler(target, maxsize=2, overflow=overflow)
+    logger = logging.getLogger(f"test_curlify3.queue.{overflow}")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    try:
+        logger.info("0")
+        # the listener is stuck emitting the first record, so the queue fills up behind it
+        assert target.entered.wait(5)
+        for message in "1234":
+            logger.info(message)
+        assert handler.dropped == 2
+    finally:
+        logger.removeHandler(handler)
+        target.release.set()
+        handler.close()
+    assert target.messages == emitted
+
+
+def test_curl_queue_handler_arguments() -> None:
+    with pytest.raises(ValueError, match="maxsize"):
+        CurlQueueHandler(maxsize=0)
+    with pytest.raises(ValueError, match="unknown overflow policy"):
+        CurlQueueHandler(overflow="block")  # type: ignore[arg-type]
 
 
 def test_requests_streaming_body_is_dropped() -> None:
@@ -1516,6 +1956,21 @@ def test_to_curl_multipart_field_file_reference(
     assert f" {expected} " in to_curl(req)
 
 
+@pytest.mark.parametrize("client", [httpx, httpx2], ids=["httpx", "httpx2"])
+def test_to_curl_multipart_file_is_not_read(
+    client: Any,  # noqa: ANN401
+) -> None:
+    # the fields of a files= request are handed over as they are, so a file part renders
+    # from its filename without the file being read — or the body being encoded
+    req = client.Request(
+        method="POST",
+        url="https://httpbin.org/post",
+        files={"image": ("image.png", _UnreadableFile())},
+        data={"foo": "bar"},
+    )
+    assert " -F 'foo=bar' -F 'image=@image.png' " in to_curl(req)
+
+
 def test_to_curl_multipart_field_bytes_value() -> None:
     # a plain field carrying bytes that are not text: rendered through the same $'...' quoting
     # a body that did not decode uses, rather than raising UnicodeDecodeError
@@ -1606,6 +2061,17 @@ def test_to_curl_multipart_boundary(
         assert expected in command
 
 
+def test_split_multipart_body_does_not_copy_values() -> None:
+    # an upload is mostly file parts whose value is never rendered, so the values come back
+    # as views into the body rather than as copies of it
+    body = b'--b\r\nContent-Disposition: form-data; name="f"; filename="x"\r\n\r\n' + b"\xff" * 1024 + b"\r\n--b--\r\n"
+    [(head, value)] = split_multipart_body(body, b"b")
+    assert head == b'\r\nContent-Disposition: form-data; name="f"; filename="x"'
+    assert isinstance(value, memoryview)
+    assert value.obj is body
+    assert value == b"\xff" * 1024
+
+
 @pytest.mark.parametrize(
     "part, expected",
     [